@@ -9,7 +9,7 @@ from uuid import UUID
 from loguru import logger
 
 from ..db.models import AiUsageEvent
-from ..db.session import get_sessionmaker
+from ..db.session import get_engine_loop, get_sessionmaker, isolated_session
 
 
 PRICING_TABLE_USD_PER_1M = {
@@ -81,16 +81,43 @@ def extract_usage_metadata(response: Any) -> Optional[dict[str, int]]:
     }
 
 
-async def _write_usage_event(event: AiUsageEvent) -> None:
-    sessionmaker = get_sessionmaker()
+async def _write_usage_event(event: AiUsageEvent, *, one_off_engine: bool = False) -> None:
     try:
-        async with sessionmaker() as session:
+        if one_off_engine:
+            async with isolated_session() as session:
+                session.add(event)
+                await session.commit()
+            return
+        async with get_sessionmaker()() as session:
             session.add(event)
             await session.commit()
     except Exception as exc:  # pragma: no cover - logging should never block primary path
         logger.warning("Failed to log AI usage event: {}", exc)
 
 
+def _submit_usage_event(event: AiUsageEvent) -> None:
+    """Write ``event`` without ever touching the pooled engine from a foreign loop.
+
+    Embedding and search calls run in worker threads; their usage rows are handed to
+    the loop that owns the engine's pool, or written through a one-off engine when
+    that loop is not running.
+    """
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    owner = get_engine_loop()
+    if running is not None and (owner is None or running is owner):
+        running.create_task(_write_usage_event(event))
+    elif owner is not None and owner.is_running():
+        asyncio.run_coroutine_threadsafe(_write_usage_event(event), owner)
+    elif running is not None:
+        running.create_task(_write_usage_event(event, one_off_engine=True))
+    else:
+        asyncio.run(_write_usage_event(event, one_off_engine=True))
+
+
 def log_ai_usage_event(
     *,
     user_id: UUID | str | None,
@@ -128,12 +155,7 @@ def log_ai_usage_event(
         cost_usd=cost_usd,
     )
 
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        asyncio.run(_write_usage_event(event))
-    else:
-        loop.create_task(_write_usage_event(event))
+    _submit_usage_event(event)
 
 
 def log_usage_from_response(
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Sequence
 
 from loguru import logger
+from redis import Redis as SyncRedis
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
@@ -54,3 +56,54 @@ async def set_cache_json(key: str, payload: Any, ttl_seconds: int) -> None:
         await client.setex(key, ttl_seconds, json.dumps(payload, default=str))
     except (RedisError, OSError, RuntimeError) as exc:
         logger.warning("Cache write failed for {}: {}", key, exc)
+
+
+async def get_cache_value(key: str) -> Optional[str]:
+    client = get_redis_client()
+    try:
+        return await client.get(key)
+    except (RedisError, OSError, RuntimeError) as exc:
+        logger.warning("Cache read failed for {}: {}", key, exc)
+        return None
+
+
+async def incr_cache_value(key: str, ttl_seconds: int) -> None:
+    client = get_redis_client()
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, ttl_seconds)
+            await pipe.execute()
+    except (RedisError, OSError, RuntimeError) as exc:
+        logger.warning("Cache write failed for {}: {}", key, exc)
+
+
+@lru_cache(maxsize=1)
+def get_sync_redis_client() -> SyncRedis:
+    """Blocking client for code that already runs off the event loop."""
+    settings = get_settings()
+    return SyncRedis.from_url(settings.redis_url)
+
+
+def get_cache_bytes_many(keys: Sequence[str]) -> list[Optional[bytes]]:
+    if not keys:
+        return []
+    client = get_sync_redis_client()
+    try:
+        return list(client.mget(keys))
+    except (RedisError, OSError) as exc:
+        logger.warning("Cache read failed for {} keys: {}", len(keys), exc)
+        return [None] * len(keys)
+
+
+def set_cache_bytes_many(entries: dict[str, bytes], ttl_seconds: int) -> None:
+    if ttl_seconds <= 0 or not entries:
+        return
+    client = get_sync_redis_client()
+    try:
+        pipeline = client.pipeline(transaction=False)
+        for key, value in entries.items():
+            pipeline.setex(key, ttl_seconds, value)
+        pipeline.execute()
+    except (RedisError, OSError) as exc:
+        logger.warning("Cache write failed for {} keys: {}", len(entries), exc)
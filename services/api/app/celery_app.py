@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any, Awaitable, TypeVar
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init, worker_process_shutdown
 from kombu import Exchange, Queue
 from loguru import logger
 
@@ -12,6 +16,51 @@ from .config import get_settings
 
 celery_app = Celery("lifelog")
 
+T = TypeVar("T")
+
+# Event loop owned by a prefork worker process; None outside of workers.
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+@worker_process_init.connect
+def _init_worker_loop(**_kwargs: Any) -> None:
+    global _worker_loop
+    from .db.session import share_engine_for_isolated_sessions
+
+    _worker_loop = _new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    share_engine_for_isolated_sessions(_worker_loop)
+
+
+@worker_process_shutdown.connect
+def _close_worker_loop(**_kwargs: Any) -> None:
+    global _worker_loop
+    if _worker_loop is None:
+        return
+    from .db.session import get_engine
+
+    try:
+        _worker_loop.run_until_complete(get_engine().dispose())
+    finally:
+        _worker_loop.close()
+        _worker_loop = None
+
+
+def run_async(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the worker's persistent loop, or via asyncio.run elsewhere."""
+
+    if _worker_loop is None:
+        return asyncio.run(coro)
+    return _worker_loop.run_until_complete(coro)
+
 
 def configure_celery() -> None:
     settings = get_settings()
@@ -52,6 +101,9 @@ def configure_celery() -> None:
         task_default_queue="default",
         task_default_exchange="default",
         task_default_routing_key="default",
+        # Recaps and media processing are long-running; don't let one worker
+        # process hoard queued tasks while its siblings sit idle.
+        worker_prefetch_multiplier=1,
     )
 
     celery_app.autodiscover_tasks(["app.tasks"], force=True)
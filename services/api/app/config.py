@@ -37,11 +37,31 @@ class Settings(BaseSettings):
     redis_url: str = Field(..., description="Redis connection URL")
     qdrant_url: AnyUrl = Field(..., description="Qdrant HTTP endpoint")
     qdrant_collection: str = "lifelog-items-v2"
+    qdrant_prefer_grpc: bool = Field(default=True, description="Talk to Qdrant over gRPC instead of REST")
+    qdrant_grpc_port: int = 6334
+    qdrant_timeout_seconds: int = Field(default=60, ge=1, description="Qdrant request timeout")
+    qdrant_upsert_batch_size: int = Field(default=64, ge=1, description="Points per Qdrant upsert request")
+    qdrant_upsert_concurrency: int = Field(default=2, ge=1, description="Concurrent Qdrant upsert requests")
+    qdrant_upsert_wait: bool = Field(
+        default=False,
+        description="Block upserts until Qdrant has applied them (read-your-writes for search)",
+    )
     embedding_dimension: int = Field(default=3072, ge=1, description="Embedding vector size")
     embedding_provider: Literal["gemini", "none"] = "gemini"
     embedding_model: str = "gemini-embedding-001"
     embedding_batch_size: int = Field(default=16, ge=1)
+    embedding_max_concurrency: int = Field(default=4, ge=1, description="Concurrent embedding requests")
+    search_embed_coalesce_ms: int = Field(
+        default=50,
+        ge=0,
+        description="Window for sharing one embedding call across concurrent searches (0 disables)",
+    )
     embedding_timeout_seconds: int = 30
+    embedding_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 60 * 60,
+        ge=0,
+        description="TTL for cached embeddings keyed by model and text (0 disables)",
+    )
     postgres_host: str = "localhost"
     postgres_port: int = 5432
     postgres_db: str = "lifelog"
@@ -201,6 +221,7 @@ class Settings(BaseSettings):
     episode_merge_similarity_threshold: float = Field(default=0.78, ge=0.0, le=1.0)
     device_episode_merge_window_minutes: int = Field(default=5, ge=0)
     memory_graph_enabled: bool = True
+    memory_graph_full_clique_edges: bool = False
 
     # Maps/Geocoding settings
     maps_geocoding_provider: Literal["google_maps", "none"] = "google_maps"
@@ -9,6 +9,7 @@ from uuid import UUID
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Computed,
     Date,
     DateTime,
     Float,
@@ -289,7 +290,7 @@ class TimelineDayHighlight(Base):
 class MemoryNode(Base):
     __tablename__ = "memory_nodes"
     __table_args__ = (
-        UniqueConstraint("user_id", "node_type", "name", name="memory_nodes_user_type_name_idx"),
+        Index("memory_nodes_user_type_name_lower_idx", "user_id", "node_type", "name_lower", unique=True),
         Index("memory_nodes_user_type_idx", "user_id", "node_type"),
     )
 
@@ -299,6 +300,7 @@ class MemoryNode(Base):
     user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"))
     node_type: Mapped[str] = mapped_column(String(64), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
+    name_lower: Mapped[str] = mapped_column(Text, Computed("lower(name)", persisted=True))
     attributes: Mapped[dict] = mapped_column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     first_seen: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=text("NOW()"), nullable=False
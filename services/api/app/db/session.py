@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from contextlib import asynccontextmanager
 from functools import lru_cache
 from typing import AsyncIterator
@@ -56,10 +57,61 @@ async def database_healthcheck() -> bool:
         return bool(value == 1)
 
 
+# Loop whose connections fill the cached engine's pool (the API's serving loop or a
+# worker's persistent loop). asyncpg connections only work on the loop they were
+# opened on, so code on any other loop or thread must not touch that pool.
+_engine_loop: asyncio.AbstractEventLoop | None = None
+_share_worker_engine = False
+
+
+def register_engine_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Record ``loop`` as the owner of the cached engine's connection pool."""
+
+    global _engine_loop
+    _engine_loop = loop
+
+
+def get_engine_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the loop that owns the cached engine's pool, if one was registered."""
+
+    return _engine_loop
+
+
+def share_engine_for_isolated_sessions(loop: asyncio.AbstractEventLoop) -> None:
+    """Route isolated_session() on ``loop`` through the cached, pooled engine.
+
+    Celery worker processes call this once they own a long-lived event loop, so
+    tasks run on that loop reuse one connection pool instead of building an
+    engine per run.
+    """
+
+    global _share_worker_engine
+    get_sessionmaker.cache_clear()
+    get_engine.cache_clear()
+    register_engine_loop(loop)
+    _share_worker_engine = True
+
+
+def uses_shared_engine() -> bool:
+    """Return True when the running loop owns the shared worker pool."""
+
+    if not _share_worker_engine or _engine_loop is None:
+        return False
+    try:
+        return asyncio.get_running_loop() is _engine_loop
+    except RuntimeError:
+        return False
+
+
 @asynccontextmanager
 async def isolated_session() -> AsyncIterator[AsyncSession]:
     """Yield a session backed by a one-off engine for background tasks."""
 
+    if uses_shared_engine():
+        async with get_sessionmaker()() as session:
+            yield session
+        return
+
     engine = build_async_engine()
     sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
     try:
@@ -220,69 +220,105 @@ class OpenClawMemorySync:
         Returns:
             True if sync succeeded, False otherwise
         """
-        if not self.enabled:
-            return False
-
-        try:
-            event_time = context.get("event_time_utc")
-            if entry_date:
-                target_date = entry_date
-            elif event_time:
-                if isinstance(event_time, str):
-                    dt = datetime.fromisoformat(event_time.replace("Z", "+00:00"))
-                else:
-                    dt = event_time
-                target_date = dt.date()
-            else:
-                target_date = date.today()
-
-            memory_path = self.memory_dir / f"{target_date.isoformat()}.md"
+        return self.sync_memory_entries(user_id, [context], entry_date=entry_date) == 1
 
-            entry = self._format_memory_entry(context)
-            context_id = str(context.get("id") or "").strip()
-
-            # Append to existing file or create new
-            self.memory_dir.mkdir(parents=True, exist_ok=True)
+    def sync_memory_entries(
+        self,
+        user_id: str,
+        contexts: list[dict[str, Any]],
+        entry_date: date | None = None,
+    ) -> int:
+        """Sync several memory/context entries, reading and writing each daily file once.
 
-            existing = ""
-            if memory_path.exists():
-                existing = memory_path.read_text(encoding="utf-8")
-
-            if context_id:
-                start_marker = f"{self.ENTRY_START_PREFIX}{context_id} -->"
-                replacement = f"{start_marker}\n{entry}\n{self.ENTRY_END}"
-                if start_marker in existing:
-                    start_idx = existing.find(start_marker)
-                    end_idx = existing.find(self.ENTRY_END, start_idx)
-                    if start_idx >= 0 and end_idx >= 0:
-                        end_idx += len(self.ENTRY_END)
-                        content = existing[:start_idx].rstrip()
-                        if content:
-                            content += "\n\n"
-                        content += replacement
-                        trailing = existing[end_idx:].strip()
-                        if trailing:
-                            content += "\n\n" + trailing
-                    else:
-                        logger.warning(
-                            "Malformed OpenClaw entry for context {} in {}; missing end marker. Appending replacement block.",
-                            context_id,
-                            memory_path,
-                        )
-                        content = (existing.rstrip() + "\n\n" if existing.strip() else "") + replacement
-                else:
-                    content = (existing.rstrip() + "\n\n" if existing.strip() else "") + replacement
-            else:
-                content = (existing.rstrip() + "\n\n" if existing.strip() else "") + entry
+        Args:
+            user_id: The user's ID
+            contexts: Context dicts with title, summary, event_time_utc, etc.
+            entry_date: Optional date override applied to every entry
 
-            tmp_path = memory_path.with_suffix(".md.tmp")
-            tmp_path.write_text(content, encoding="utf-8")
-            tmp_path.rename(memory_path)
-            return True
+        Returns:
+            Number of entries written
+        """
+        if not self.enabled or not contexts:
+            return 0
 
-        except Exception as e:
-            logger.error(f"Failed to sync memory entry: {e}")
-            return False
+        by_date: dict[date, list[dict[str, Any]]] = {}
+        for context in contexts:
+            try:
+                target_date = entry_date or self._entry_date(context)
+            except Exception as e:
+                logger.error(f"Failed to sync memory entry: {e}")
+                continue
+            by_date.setdefault(target_date, []).append(context)
+
+        synced = 0
+        for target_date, entries in by_date.items():
+            try:
+                memory_path = self.memory_dir / f"{target_date.isoformat()}.md"
+
+                # Append to existing file or create new
+                self.memory_dir.mkdir(parents=True, exist_ok=True)
+
+                content = ""
+                if memory_path.exists():
+                    content = memory_path.read_text(encoding="utf-8")
+                merged = 0
+                for context in entries:
+                    try:
+                        content = self._merge_memory_entry(content, context, memory_path)
+                    except Exception as e:
+                        logger.error(f"Failed to sync memory entry: {e}")
+                        continue
+                    merged += 1
+                if not merged:
+                    continue
+
+                tmp_path = memory_path.with_suffix(".md.tmp")
+                tmp_path.write_text(content, encoding="utf-8")
+                tmp_path.rename(memory_path)
+                synced += merged
+
+            except Exception as e:
+                logger.error(f"Failed to sync memory entry: {e}")
+        return synced
+
+    @staticmethod
+    def _entry_date(context: dict[str, Any]) -> date:
+        event_time = context.get("event_time_utc")
+        if not event_time:
+            return date.today()
+        if isinstance(event_time, str):
+            return datetime.fromisoformat(event_time.replace("Z", "+00:00")).date()
+        return event_time.date()
+
+    def _merge_memory_entry(self, existing: str, context: dict[str, Any], memory_path: Path) -> str:
+        """Return file content with the entry appended, or replaced if already present."""
+        entry = self._format_memory_entry(context)
+        context_id = str(context.get("id") or "").strip()
+
+        if not context_id:
+            return (existing.rstrip() + "\n\n" if existing.strip() else "") + entry
+
+        start_marker = f"{self.ENTRY_START_PREFIX}{context_id} -->"
+        replacement = f"{start_marker}\n{entry}\n{self.ENTRY_END}"
+        if start_marker in existing:
+            start_idx = existing.find(start_marker)
+            end_idx = existing.find(self.ENTRY_END, start_idx)
+            if start_idx >= 0 and end_idx >= 0:
+                end_idx += len(self.ENTRY_END)
+                content = existing[:start_idx].rstrip()
+                if content:
+                    content += "\n\n"
+                content += replacement
+                trailing = existing[end_idx:].strip()
+                if trailing:
+                    content += "\n\n" + trailing
+                return content
+            logger.warning(
+                "Malformed OpenClaw entry for context {} in {}; missing end marker. Appending replacement block.",
+                context_id,
+                memory_path,
+            )
+        return (existing.rstrip() + "\n\n" if existing.strip() else "") + replacement
 
     def _format_memory_entry(self, context: dict[str, Any]) -> str:
         """Format a single context as a memory entry."""
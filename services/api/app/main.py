@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
 
 from .config import get_settings
+from .db.session import register_engine_loop
 from .routes import get_api_router
 
 
@@ -56,6 +59,8 @@ app.include_router(get_api_router())
 @app.on_event("startup")
 async def on_startup():  # pragma: no cover - runtime logging
     logger.info("Starting {} v{}", settings.api_title, settings.api_version)
+    # Route usage logging from worker threads back onto the loop that owns the DB pool.
+    register_engine_loop(asyncio.get_running_loop())
 
 
 @app.on_event("shutdown")
@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..config import get_settings
 from ..db.models import SourceItem
 from ..storage import get_storage_provider
-from ..user_settings import fetch_user_settings
+from ..user_settings import fetch_user_settings_cached
 from .steps import get_pipeline_steps
 from .types import ArtifactStore, PipelineArtifacts, PipelineConfig
 
@@ -150,7 +150,7 @@ async def run_pipeline(
 ) -> PipelineArtifacts:
     settings = get_settings()
     storage = get_storage_provider()
-    user_settings = await fetch_user_settings(session, item.user_id)
+    user_settings = await fetch_user_settings_cached(session, item.user_id)
     config = PipelineConfig(
         session=session,
         storage=storage,
@@ -161,7 +161,11 @@ async def run_pipeline(
     )
     artifacts = PipelineArtifacts(ArtifactStore(session, item))
     steps = get_pipeline_steps(item.item_type)
-    logger.info("Pipeline start item={} steps={}", item.id, [step.name for step in steps])
+    logger.opt(lazy=True).info(
+        "Pipeline start item={} steps={}",
+        lambda: item.id,
+        lambda: [step.name for step in steps],
+    )
     for step in steps:
         if artifacts.skip_expensive and step.is_expensive:
             logger.info("Pipeline step skipped item={} step={} reason=dedupe", item.id, step.name)
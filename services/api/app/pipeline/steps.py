@@ -15,6 +15,7 @@ from uuid import UUID
 import httpx
 from loguru import logger
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 
 from ..ai import (
     analyze_audio_with_gemini,
@@ -208,13 +209,12 @@ def _merge_contexts(
 async def _upsert_content(
     session, item_id: UUID, role: str, data: dict[str, Any]
 ) -> None:
-    await session.execute(
-        delete(ProcessedContent).where(
-            ProcessedContent.item_id == item_id,
-            ProcessedContent.content_role == role,
-        )
+    stmt = insert(ProcessedContent).values(item_id=item_id, content_role=role, data=data)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProcessedContent.item_id, ProcessedContent.content_role],
+        set_={"data": stmt.excluded.data},
     )
-    session.add(ProcessedContent(item_id=item_id, content_role=role, data=data))
+    await session.execute(stmt)
 
 
 async def _fetch_item_blob(session, storage, item: SourceItem) -> bytes:
@@ -2240,7 +2240,7 @@ class ContextPersistStep:
         )
         if deleted_context_ids:
             try:
-                delete_context_embeddings(deleted_context_ids)
+                await asyncio.to_thread(delete_context_embeddings, deleted_context_ids)
             except Exception as exc:  # pragma: no cover - external service dependency
                 logger.warning("Failed to delete embeddings for item {}: {}", item.id, exc)
 
@@ -2327,7 +2327,7 @@ class EmbeddingStep:
             return
 
         try:
-            upsert_context_embeddings(context_records)
+            await asyncio.to_thread(upsert_context_embeddings, context_records)
         except Exception as exc:  # pragma: no cover - external service dependency
             logger.warning("Failed to upsert embeddings for item {}: {}", item.id, exc)
             return
@@ -2363,11 +2363,8 @@ class MemoryGraphEnqueueStep:
     async def run(self, item: SourceItem, artifacts: PipelineArtifacts, config: PipelineConfig) -> None:
         if not getattr(config.settings, "memory_graph_enabled", True):
             return
-        try:
-            from ..celery_app import celery_app
-        except Exception:  # pragma: no cover - import guard
-            return
-        celery_app.send_task("memory_graph.update_for_item", args=[str(item.id)])
+        # Dispatched by the process_item task once the item is committed as completed.
+        artifacts.set("memory_graph_pending", True)
 
 
 COMMON_STEPS: list[PipelineStep] = [
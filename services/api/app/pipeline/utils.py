@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 import hashlib
 import io
 import re
@@ -131,15 +132,28 @@ def _filter_keywords(keywords: list[str], context_type: str | None) -> list[str]
     return filtered
 
 
-def build_vector_text(
+@lru_cache(maxsize=10_000)
+def _build_vector_text_cached(
     title: str,
     summary: str,
-    keywords: list[str],
-    *,
-    context_type: str | None = None,
+    keywords: tuple[str, ...],
+    context_type: str | None,
 ) -> str:
     parts = [title.strip(), summary.strip()]
-    filtered = _filter_keywords(keywords, context_type)
+    filtered = _filter_keywords(list(keywords), context_type)
     if filtered:
         parts.append("Keywords: " + ", ".join(filtered))
     return "\n".join(part for part in parts if part)
+
+
+def build_vector_text(
+    title: str,
+    summary: str,
+    keywords: list[str],
+    *,
+    context_type: str | None = None,
+) -> str:
+    # Keywords are normalized to strings up front so the cache key is hashable;
+    # _filter_keywords stringifies them the same way.
+    keyword_key = tuple(str(word or "") for word in keywords or ())
+    return _build_vector_text_cached(title, summary, keyword_key, context_type)
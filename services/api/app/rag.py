@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta, timezone
@@ -822,7 +823,8 @@ async def retrieve_context_hits(
     candidate_limit = max(top_k * 4, 40)
     if recency_intent:
         candidate_limit = max(candidate_limit, top_k * 8, 80)
-    vector_candidates = search_contexts(
+    vector_candidates = await asyncio.to_thread(
+        search_contexts,
         query,
         limit=candidate_limit,
         user_id=str(user_id),
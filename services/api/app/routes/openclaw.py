@@ -431,7 +431,8 @@ async def search_for_openclaw(
     )
 
     # Search contexts using vector search
-    results = search_contexts(
+    results = await asyncio.to_thread(
+        search_contexts,
         request.query,
         limit=request.limit,
         user_id=str(user_id),
@@ -442,7 +443,8 @@ async def search_for_openclaw(
 
     # Fallback to non-episode contexts if needed
     if len(results) < request.limit:
-        fallback = search_contexts(
+        fallback = await asyncio.to_thread(
+            search_contexts,
             request.query,
             limit=request.limit * 2,
             user_id=str(user_id),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Optional
 from uuid import UUID
@@ -56,7 +57,8 @@ async def search_items(
 
     provider_filter = provider.strip() if provider else None
 
-    results = search_contexts(
+    results = await asyncio.to_thread(
+        search_contexts,
         q,
         limit=limit,
         user_id=str(user_id),
@@ -65,7 +67,8 @@ async def search_items(
         end_time=filter_end,
     )
     if len(results) < limit:
-        fallback = search_contexts(
+        fallback = await asyncio.to_thread(
+            search_contexts,
             q,
             limit=limit * 2,
             user_id=str(user_id),
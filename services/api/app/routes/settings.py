@@ -17,7 +17,7 @@ from ..db.models import ApiKey, UserSettings
 from ..db.session import get_session
 from ..recaps import resolve_week_window
 from ..tasks.recaps import weekly_recap_for_user
-from ..user_settings import fetch_user_settings
+from ..user_settings import fetch_user_settings, invalidate_user_settings_cache
 from ..config import get_settings
 
 
@@ -102,6 +102,7 @@ async def update_user_settings(
     )
     await session.execute(stmt)
     await session.commit()
+    await invalidate_user_settings_cache(user_id)
     return SettingsResponse(settings=settings_payload, updated_at=now)
 
 
@@ -1877,7 +1877,7 @@ async def delete_timeline_item(
 
     if deleted_context_ids:
         try:
-            delete_context_embeddings(deleted_context_ids)
+            await asyncio.to_thread(delete_context_embeddings, deleted_context_ids)
         except Exception as exc:  # pragma: no cover - external service dependency
             logger.warning("Failed to delete embeddings: {}", exc)
     if updated_contexts:
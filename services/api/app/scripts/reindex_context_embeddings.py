@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+from contextlib import nullcontext
 from typing import Optional
 from uuid import UUID
 
@@ -11,7 +12,7 @@ from sqlalchemy import select
 
 from app.db.models import ProcessedContext
 from app.db.session import isolated_session
-from app.vectorstore import upsert_context_embeddings
+from app.vectorstore import bulk_ingest, upsert_context_embeddings
 
 
 async def _reindex(
@@ -23,6 +24,9 @@ async def _reindex(
     async with isolated_session() as session:
         offset = 0
         total = 0
+        # Embedding + upsert of one batch runs in a thread while the next batch is read.
+        in_flight: Optional[asyncio.Future] = None
+        in_flight_count = 0
         while True:
             stmt = select(ProcessedContext).order_by(ProcessedContext.created_at.asc())
             if user_id:
@@ -33,13 +37,17 @@ async def _reindex(
 
             rows = await session.execute(stmt)
             contexts = list(rows.scalars().all())
+            if in_flight is not None:
+                await in_flight
+                total += in_flight_count
+                print(f"Upserted {in_flight_count} contexts (total={total})")
+                in_flight = None
             if not contexts:
                 break
 
-            upsert_context_embeddings(contexts)
-            total += len(contexts)
+            in_flight = asyncio.ensure_future(asyncio.to_thread(upsert_context_embeddings, contexts))
+            in_flight_count = len(contexts)
             offset += len(contexts)
-            print(f"Upserted {len(contexts)} contexts (total={total})")
 
         print(f"Done. Total contexts reindexed: {total}")
 
@@ -49,19 +57,25 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--user-id", help="Filter by user UUID", default=None)
     parser.add_argument("--context-type", help="Filter by context_type", default=None)
     parser.add_argument("--batch-size", type=int, default=200, help="Batch size for reindexing")
+    parser.add_argument(
+        "--defer-indexing",
+        action="store_true",
+        help="Pause Qdrant HNSW indexing during the reindex and rebuild it once at the end",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = _parse_args()
     user_id = UUID(args.user_id) if args.user_id else None
-    asyncio.run(
-        _reindex(
-            user_id=user_id,
-            context_type=args.context_type,
-            batch_size=args.batch_size,
+    with bulk_ingest() if args.defer_indexing else nullcontext():
+        asyncio.run(
+            _reindex(
+                user_id=user_id,
+                context_type=args.context_type,
+                batch_size=args.batch_size,
+            )
         )
-    )
 
 
 if __name__ == "__main__":
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime
 from typing import Any, Iterable, Optional
 from uuid import UUID
@@ -10,7 +9,7 @@ from uuid import UUID
 from loguru import logger
 from sqlalchemy import exists, select
 
-from ..celery_app import celery_app
+from ..celery_app import celery_app, run_async
 from ..db.models import DEFAULT_TEST_USER_ID, DerivedArtifact, SourceItem
 from ..db.session import isolated_session
 from ..pipeline.utils import parse_iso_datetime
@@ -109,7 +108,7 @@ def backfill_pipeline(
     since_dt = parse_iso_datetime(since) if since else None
     until_dt = parse_iso_datetime(until) if until else None
 
-    return asyncio.run(
+    return run_async(
         _enqueue_backfill(
             user_id=resolved_user,
             limit=limit,
@@ -14,7 +14,7 @@ from loguru import logger
 from sqlalchemy import delete, exists, select
 from sqlalchemy.dialects.postgresql import insert
 
-from ..celery_app import celery_app
+from ..celery_app import celery_app, run_async
 from ..ai import summarize_text_with_gemini
 from ..ai.prompts import build_lifelog_episode_summary_prompt
 from ..config import Settings, get_settings
@@ -480,7 +480,10 @@ async def _update_daily_summary(
                 await session.delete(context)
             await session.flush()
             try:
-                delete_context_embeddings([str(context.id) for context in summary_contexts])
+                await asyncio.to_thread(
+                    delete_context_embeddings,
+                    [str(context.id) for context in summary_contexts],
+                )
             except Exception as exc:  # pragma: no cover - external service dependency
                 logger.warning("Daily summary embedding delete failed: {}", exc)
         delete_dates = {summary_date}
@@ -648,7 +651,7 @@ async def _update_daily_summary(
     )
 
     await session.flush()
-    upsert_context_embeddings([summary_context])
+    await asyncio.to_thread(upsert_context_embeddings, [summary_context])
 
     # Sync to OpenClaw if enabled
     try:
@@ -676,10 +679,10 @@ async def _update_daily_summary(
         logger.warning("OpenClaw sync failed: {}", exc)
 
 
-async def _update_episode_for_item(item_id: str) -> dict[str, Any]:
+async def _update_episode_for_item(item_id: UUID) -> dict[str, Any]:
     settings = get_settings()
     async with isolated_session() as session:
-        item = await session.get(SourceItem, UUID(item_id))
+        item = await session.get(SourceItem, item_id)
         if not item:
             return {"status": "missing_item"}
         if item.processing_status != "completed":
@@ -722,7 +725,8 @@ async def _update_episode_for_item(item_id: str) -> dict[str, Any]:
         existing_by_type: dict[str, ProcessedContext] = {}
 
         if settings.episode_merge_enabled:
-            candidates = search_contexts(
+            candidates = await asyncio.to_thread(
+                search_contexts,
                 primary.vector_text or primary.summary or primary.title,
                 limit=6,
                 user_id=str(item.user_id),
@@ -951,7 +955,7 @@ async def _update_episode_for_item(item_id: str) -> dict[str, Any]:
         for record in episode_records:
             session.add(record)
         await session.flush()
-        upsert_context_embeddings(episode_records)
+        await asyncio.to_thread(upsert_context_embeddings, episode_records)
         summary_date = start_time.date()
         summary_date_locked = False
         summary_context: Optional[ProcessedContext] = None
@@ -1008,7 +1012,12 @@ async def _update_episode_for_item(item_id: str) -> dict[str, Any]:
 @celery_app.task(name="episodes.update_for_item")
 def update_episode_for_item(item_id: str) -> dict[str, Any]:
     try:
-        return asyncio.run(_update_episode_for_item(item_id))
+        resolved = UUID(item_id)
+    except Exception as exc:  # pragma: no cover - validation guard
+        logger.warning("Invalid item id for episode merge: {}", exc)
+        return {"status": "error", "reason": "invalid_item_id"}
+    try:
+        return run_async(_update_episode_for_item(resolved))
     except Exception as exc:  # pragma: no cover - background task robustness
         logger.exception("Episode merge failed for item {}: {}", item_id, exc)
         raise
@@ -1038,7 +1047,7 @@ def update_daily_summary(
             await session.commit()
 
     try:
-        asyncio.run(_run())
+        run_async(_run())
     except Exception as exc:  # pragma: no cover - background task robustness
         logger.exception("Daily summary update failed for {}: {}", summary_date, exc)
         raise
@@ -1119,7 +1128,7 @@ def backfill_episodes(
     resolved_user = UUID(user_id) if user_id else DEFAULT_TEST_USER_ID
     since_dt = parse_iso_datetime(since) if since else None
     until_dt = parse_iso_datetime(until) if until else None
-    return asyncio.run(
+    return run_async(
         _backfill_episodes(
             user_id=resolved_user,
             limit=limit,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timezone
 from typing import Any, Optional
 from uuid import UUID, uuid4
@@ -13,7 +12,7 @@ from pathlib import Path
 import httpx
 from sqlalchemy import select, or_
 
-from ..celery_app import celery_app
+from ..celery_app import celery_app, run_async
 from ..db.models import DEFAULT_TEST_USER_ID, DataConnection, SourceItem, User
 from ..db.session import isolated_session
 from ..google_photos import (
@@ -254,7 +253,7 @@ def sync_google_photos_media(self, session_id: Optional[str] = None, user_id: Op
     """Fetch Google Photos media items and enqueue ingestion."""
 
     try:
-        return asyncio.run(_sync_google_photos(session_id, user_id))
+        return run_async(_sync_google_photos(session_id, user_id))
     except Exception as exc:  # pragma: no cover - task boundary
         logger.exception("Google Photos sync failed: {}", exc)
         raise
@@ -8,8 +8,9 @@ from uuid import UUID
 
 from loguru import logger
 from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..celery_app import celery_app
+from ..celery_app import celery_app, run_async
 from ..db.models import Device, ProcessedContext
 from ..db.session import isolated_session
 from ..pipeline.utils import build_vector_text
@@ -63,7 +64,7 @@ def cleanup_pairing_codes() -> dict[str, int | str]:
     """Clear expired pairing codes on a schedule."""
 
     try:
-        return asyncio.run(_cleanup_expired_pairing_codes())
+        return run_async(_cleanup_expired_pairing_codes())
     except Exception as exc:  # pragma: no cover - avoid crashing beat
         logger.exception("Failed to cleanup pairing codes: {}", exc)
         raise
@@ -84,48 +85,77 @@ async def _reembed_contexts(
     total_seen = 0
     total_updated = 0
     batches = 0
-
-    async with isolated_session() as session:
+    # Bounded hand-off between the DB side and the embedding side so the next
+    # batch is fetched while the previous one is being embedded.
+    embed_queue: asyncio.Queue[list[ProcessedContext] | None] = asyncio.Queue(maxsize=2)
+
+    async def fetch(session: AsyncSession) -> None:
+        nonlocal offset, total_seen, batches
+        try:
+            while True:
+                stmt = select(ProcessedContext).order_by(
+                    ProcessedContext.created_at.asc(),
+                    ProcessedContext.id.asc(),
+                )
+                if user_uuid:
+                    stmt = stmt.where(ProcessedContext.user_id == user_uuid)
+                if context_type:
+                    stmt = stmt.where(ProcessedContext.context_type == context_type)
+                stmt = stmt.limit(batch_size).offset(offset)
+
+                result = await session.execute(stmt)
+                contexts = list(result.scalars().all())
+                if not contexts:
+                    break
+                # Detach the batch: new vector_text is only written once embed() has
+                # upserted it, so a failed upsert leaves the row for the next run.
+                session.expunge_all()
+
+                changed: list[ProcessedContext] = []
+                for context in contexts:
+                    vector_text = build_vector_text(
+                        context.title or "",
+                        context.summary or "",
+                        context.keywords or [],
+                        context_type=context.context_type,
+                    )
+                    if context.vector_text != vector_text:
+                        context.vector_text = vector_text
+                        changed.append(context)
+
+                # Embeddings only depend on vector_text, so unchanged rows need neither
+                # a write nor a re-upsert.
+                if changed:
+                    await embed_queue.put(changed)
+
+                total_seen += len(contexts)
+                offset += batch_size
+                batches += 1
+                if max_batches and batches >= max_batches:
+                    break
+        finally:
+            await embed_queue.put(None)
+
+    async def embed(session: AsyncSession) -> None:
+        nonlocal total_updated
         while True:
-            stmt = select(ProcessedContext).order_by(
-                ProcessedContext.created_at.asc(),
-                ProcessedContext.id.asc(),
-            )
-            if user_uuid:
-                stmt = stmt.where(ProcessedContext.user_id == user_uuid)
-            if context_type:
-                stmt = stmt.where(ProcessedContext.context_type == context_type)
-            stmt = stmt.limit(batch_size).offset(offset)
-
-            result = await session.execute(stmt)
-            contexts = list(result.scalars().all())
-            if not contexts:
+            batch = await embed_queue.get()
+            if batch is None:
                 break
-
-            for context in contexts:
-                vector_text = build_vector_text(
-                    context.title or "",
-                    context.summary or "",
-                    context.keywords or [],
-                    context_type=context.context_type,
-                )
-                if context.vector_text != vector_text:
-                    context.vector_text = vector_text
-                    total_updated += 1
-
-            await session.flush()
             try:
-                upsert_context_embeddings(contexts)
+                await asyncio.to_thread(upsert_context_embeddings, batch)
             except Exception as exc:  # pragma: no cover - external dependency
                 logger.warning("Embedding upsert failed: {}", exc)
-
+                continue
+            await session.execute(
+                update(ProcessedContext),
+                [{"id": context.id, "vector_text": context.vector_text} for context in batch],
+            )
             await session.commit()
+            total_updated += len(batch)
 
-            total_seen += len(contexts)
-            offset += batch_size
-            batches += 1
-            if max_batches and batches >= max_batches:
-                break
+    async with isolated_session() as session, isolated_session() as write_session:
+        await asyncio.gather(fetch(session), embed(write_session))
 
     return {
         "status": "ok",
@@ -147,7 +177,7 @@ def reembed_contexts(
     """Rebuild vector_text and upsert embeddings for processed contexts."""
 
     try:
-        return asyncio.run(
+        return run_async(
             _reembed_contexts(
                 user_id=user_id,
                 context_type=context_type,
@@ -2,17 +2,16 @@
 
 from __future__ import annotations
 
-import asyncio
-from datetime import datetime, timezone
 from itertools import combinations
 from typing import Any, Iterable
 from uuid import UUID
 
 from loguru import logger
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text, update
 from sqlalchemy.dialects.postgresql import insert
 
-from ..celery_app import celery_app
+from ..celery_app import celery_app, run_async
+from ..config import get_settings
 from ..db.models import MemoryEdge, MemoryNode, ProcessedContext, SourceItem
 from ..db.session import isolated_session
 
@@ -30,35 +29,66 @@ NODE_TYPE_MAP = {
     "activity": "activity",
 }
 
+# Lower value wins when picking the hub node for star-pattern co-occurrence edges.
+ANCHOR_TYPE_PRIORITY = {
+    "person": 0,
+    "place": 1,
+    "org": 2,
+    "activity": 3,
+    "topic": 4,
+    "food": 5,
+    "object": 6,
+}
+
+# Contexts pulled from the server-side cursor per graph write.
+CONTEXT_STREAM_BATCH_SIZE = 50
+
+# Rows per lookup/INSERT batch when flushing an item's nodes.
+UPSERT_CHUNK_SIZE = 500
 
-def _normalize_node_type(raw_type: str | None) -> str:
-    if not raw_type:
-        return "other"
-    cleaned = raw_type.strip().lower()
-    return NODE_TYPE_MAP.get(cleaned, cleaned if cleaned else "other")
+# Above this many edges a multi-row INSERT becomes parser-bound; stage via COPY instead.
+EDGE_COPY_THRESHOLD = 100
+
+# Write pending edges once this many distinct ones have built up, so an item with a
+# long context stream holds a bounded edge map. Splitting is safe: ON CONFLICT sums.
+EDGE_FLUSH_THRESHOLD = 5000
+
+_EDGE_COLUMNS = (
+    "user_id",
+    "source_node_id",
+    "target_node_id",
+    "relation_type",
+    "strength",
+    "mention_count",
+    "source_item_id",
+    "source_context_id",
+)
 
 
 def _normalize_entity_name(name: str | None) -> str:
     if not name:
         return ""
-    return " ".join(str(name).strip().split())
+    return " ".join(str(name).split())
 
 
 def _collect_entity_payloads(context: ProcessedContext) -> list[dict[str, Any]]:
-    entries: list[dict[str, Any]] = []
-    seen: set[tuple[str, str]] = set()
-    for entity in context.entities or []:
+    # Insertion-ordered dict keyed on (node_type, name_lower) dedupes in one pass; the
+    # lowered name is computed once here and reused as the node cache key.
+    get_type = NODE_TYPE_MAP.get
+    entries: dict[tuple[str, str], dict[str, Any]] = {}
+    for entity in context.entities or ():
         if not isinstance(entity, dict):
             continue
-        node_type = _normalize_node_type(str(entity.get("type") or ""))
         name = _normalize_entity_name(entity.get("name"))
         if not name:
             continue
-        key = (node_type, name.lower())
-        if key in seen:
-            continue
-        seen.add(key)
-        entries.append({"node_type": node_type, "name": name, "attributes": entity})
+        raw_type = str(entity.get("type") or "").strip().lower()
+        node_type = get_type(raw_type, raw_type or "other")
+        name_lower = name.lower()
+        entries.setdefault(
+            (node_type, name_lower),
+            {"node_type": node_type, "name": name, "name_lower": name_lower, "attributes": entity},
+        )
 
     location = context.location or {}
     if isinstance(location, dict):
@@ -68,94 +98,277 @@ def _collect_entity_payloads(context: ProcessedContext) -> list[dict[str, Any]]:
             or location.get("formatted_address")
         )
         if location_name:
-            key = ("place", location_name.lower())
-            if key not in seen:
-                seen.add(key)
-                entries.append(
-                    {
-                        "node_type": "place",
-                        "name": location_name,
-                        "attributes": {"source": "location", "raw": location},
-                    }
-                )
-    return entries
-
-
-async def _upsert_node(
+            location_lower = location_name.lower()
+            entries.setdefault(
+                ("place", location_lower),
+                {
+                    "node_type": "place",
+                    "name": location_name,
+                    "name_lower": location_lower,
+                    "attributes": {"source": "location", "raw": location},
+                },
+            )
+    return list(entries.values())
+
+
+async def _resolve_nodes(
+    session,
+    *,
+    user_id: UUID,
+    payloads: list[dict[str, Any]],
+) -> dict[tuple[str, str], UUID]:
+    """Map payloads to node ids, touching existing nodes and inserting only new ones.
+
+    Names are lowered by Postgres in the lookup, so the result maps each payload's
+    Python key to the node the ``name_lower`` column actually matches even where
+    ``str.lower()`` and ``lower()`` disagree.
+    """
+
+    if not payloads:
+        return {}
+    keys = [(payload["node_type"], payload["name_lower"]) for payload in payloads]
+    rows = await session.execute(
+        text(
+            "SELECT k.ord, lower(k.name) AS name_lower, n.id "
+            "FROM unnest(CAST(:node_types AS text[]), CAST(:names AS text[])) "
+            "WITH ORDINALITY AS k(node_type, name, ord) "
+            "LEFT JOIN memory_nodes n ON n.user_id = :user_id "
+            "AND n.node_type = k.node_type AND n.name_lower = lower(k.name)"
+        ),
+        {
+            "node_types": [payload["node_type"] for payload in payloads],
+            "names": [payload["name"] for payload in payloads],
+            "user_id": user_id,
+        },
+    )
+    db_keys: dict[tuple[str, str], tuple[str, str]] = {}
+    resolved: dict[tuple[str, str], UUID] = {}
+    missing: dict[tuple[str, str], dict[str, Any]] = {}
+    for ordinal, db_name_lower, node_id in rows.all():
+        payload = payloads[ordinal - 1]
+        key = keys[ordinal - 1]
+        db_key = (payload["node_type"], db_name_lower)
+        db_keys[key] = db_key
+        if node_id is None:
+            # One INSERT cannot hit the same conflict key twice.
+            missing.setdefault(db_key, payload)
+        else:
+            resolved[key] = node_id
+
+    if resolved:
+        table = MemoryNode.__table__
+        await session.execute(
+            update(table)
+            .where(table.c.id.in_(set(resolved.values())))
+            .values(last_seen=func.now(), mention_count=table.c.mention_count + 1)
+        )
+    # Missing nodes still go through ON CONFLICT in case another worker inserted them.
+    inserted = await _upsert_nodes(session, user_id=user_id, payloads=list(missing.values()))
+    for key, db_key in db_keys.items():
+        if key not in resolved:
+            resolved[key] = inserted[db_key]
+    return resolved
+
+
+async def _upsert_nodes(
     session,
     *,
     user_id: UUID,
-    node_type: str,
-    name: str,
-    attributes: dict[str, Any],
-) -> UUID:
+    payloads: list[dict[str, Any]],
+) -> dict[tuple[str, str], UUID]:
+    """Upsert entity nodes in one statement and map (node_type, Postgres name_lower) to ids."""
+
+    if not payloads:
+        return {}
     table = MemoryNode.__table__
     stmt = (
         insert(table)
         .values(
-            {
-                "user_id": user_id,
-                "node_type": node_type,
-                "name": name,
-                "attributes": attributes,
-                "first_seen": datetime.now(timezone.utc),
-                "last_seen": datetime.now(timezone.utc),
-                "mention_count": 1,
-            }
+            [
+                {
+                    "user_id": user_id,
+                    "node_type": payload["node_type"],
+                    "name": payload["name"],
+                    "attributes": payload.get("attributes", {}),
+                    "mention_count": 1,
+                }
+                for payload in payloads
+            ]
         )
         .on_conflict_do_update(
-            index_elements=[table.c.user_id, table.c.node_type, table.c.name],
+            index_elements=[table.c.user_id, table.c.node_type, table.c.name_lower],
             set_={
                 "last_seen": func.now(),
                 "mention_count": table.c.mention_count + 1,
             },
         )
-        .returning(table.c.id)
+        .returning(table.c.id, table.c.node_type, table.c.name_lower)
     )
     result = await session.execute(stmt)
-    return result.scalar_one()
+    return {(node_type, name_lower): node_id for node_id, node_type, name_lower in result.all()}
 
 
-async def _upsert_edge(
-    session,
-    *,
-    user_id: UUID,
-    source_node_id: UUID,
-    target_node_id: UUID,
-    relation_type: str,
-    source_item_id: UUID,
-    source_context_id: UUID,
-    strength: float = 1.0,
-) -> None:
-    if source_node_id == target_node_id:
+async def _copy_upsert_edges(session, edge_rows: list[dict[str, Any]]) -> None:
+    """Stage edges with COPY into a temp table, then merge with INSERT ... SELECT."""
+
+    columns = ", ".join(_EDGE_COLUMNS)
+    # Issue the DDL through the session so it runs inside the current transaction.
+    await session.execute(
+        text(
+            "CREATE TEMP TABLE IF NOT EXISTS _stage_edges "
+            "(LIKE memory_edges INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+    )
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        "_stage_edges",
+        records=[tuple(row[column] for column in _EDGE_COLUMNS) for row in edge_rows],
+        columns=list(_EDGE_COLUMNS),
+    )
+    await session.execute(
+        text(
+            f"INSERT INTO memory_edges ({columns}) "
+            f"SELECT {columns} FROM _stage_edges "
+            "ON CONFLICT (user_id, source_node_id, target_node_id, relation_type) DO UPDATE SET "
+            "strength = memory_edges.strength + EXCLUDED.strength, "
+            "mention_count = memory_edges.mention_count + EXCLUDED.mention_count, "
+            "last_connected = NOW()"
+        )
+    )
+    await session.execute(text("TRUNCATE _stage_edges"))
+
+
+async def _upsert_edges(session, edge_rows: list[dict[str, Any]]) -> None:
+    """Upsert co-occurrence edges in one multi-row INSERT ... ON CONFLICT.
+
+    Existing edges keep the item/context that first linked them, so a repeat
+    co-occurrence only bumps counters.
+    """
+
+    if not edge_rows:
+        return
+    if len(edge_rows) >= EDGE_COPY_THRESHOLD:
+        await _copy_upsert_edges(session, edge_rows)
         return
     table = MemoryEdge.__table__
-    stmt = insert(table).values(
-        {
-            "user_id": user_id,
-            "source_node_id": source_node_id,
-            "target_node_id": target_node_id,
-            "relation_type": relation_type,
-            "strength": strength,
-            "mention_count": 1,
-            "last_connected": datetime.now(timezone.utc),
-            "source_item_id": source_item_id,
-            "source_context_id": source_context_id,
-        }
-    )
+    stmt = insert(table).values(edge_rows)
     stmt = stmt.on_conflict_do_update(
         index_elements=[table.c.user_id, table.c.source_node_id, table.c.target_node_id, table.c.relation_type],
         set_={
             "strength": table.c.strength + stmt.excluded.strength,
-            "mention_count": table.c.mention_count + 1,
+            "mention_count": table.c.mention_count + stmt.excluded.mention_count,
             "last_connected": func.now(),
-            "source_item_id": stmt.excluded.source_item_id,
-            "source_context_id": stmt.excluded.source_context_id,
         },
     )
     await session.execute(stmt)
 
 
+def _edge_pairs(
+    node_ids: list[UUID],
+    node_types: dict[UUID, str],
+    *,
+    full_clique: bool,
+) -> list[tuple[UUID, UUID]]:
+    """Return (source, target) pairs, ordered so each edge has one canonical direction.
+
+    Star mode links every node to a single anchor (k-1 edges); full-clique mode
+    links every pair (k*(k-1)/2 edges).
+    """
+
+    unique_nodes = sorted(set(node_ids))
+    if full_clique:
+        return list(combinations(unique_nodes, 2))
+    if len(unique_nodes) < 2:
+        return []
+    first_seen: dict[UUID, int] = {}
+    for index, node_id in enumerate(node_ids):
+        first_seen.setdefault(node_id, index)
+    fallback_priority = len(ANCHOR_TYPE_PRIORITY)
+    anchor = min(
+        unique_nodes,
+        key=lambda node_id: (
+            ANCHOR_TYPE_PRIORITY.get(node_types.get(node_id, ""), fallback_priority),
+            first_seen[node_id],
+        ),
+    )
+    return [
+        (anchor, node_id) if anchor < node_id else (node_id, anchor)
+        for node_id in unique_nodes
+        if node_id != anchor
+    ]
+
+
+async def _write_context_batch(
+    session,
+    item: SourceItem,
+    contexts: Iterable[ProcessedContext],
+    node_cache: dict[tuple[str, str], UUID],
+    pending_edges: dict[tuple[int, int], dict[str, Any]],
+    *,
+    full_clique: bool,
+) -> tuple[int, int]:
+    """Upsert a batch's nodes and fold its edges into ``pending_edges``.
+
+    Returns (nodes_touched, edges_created).
+    """
+
+    edges_created = 0
+    nodes_touched = 0
+
+    # Gather the batch's entities first so each node is resolved once per item.
+    pending_nodes: dict[tuple[str, str], dict[str, Any]] = {}
+    context_keys: list[tuple[ProcessedContext, list[tuple[str, str]]]] = []
+    for context in contexts:
+        payloads = _collect_entity_payloads(context)
+        if not payloads:
+            continue
+        keys = [(payload["node_type"], payload["name_lower"]) for payload in payloads]
+        for payload, key in zip(payloads, keys):
+            if key not in node_cache:
+                pending_nodes.setdefault(key, payload)
+        context_keys.append((context, keys))
+        nodes_touched += len(keys)
+
+    node_payloads = list(pending_nodes.values())
+    for start in range(0, len(node_payloads), UPSERT_CHUNK_SIZE):
+        node_cache.update(
+            await _resolve_nodes(
+                session,
+                user_id=item.user_id,
+                payloads=node_payloads[start : start + UPSERT_CHUNK_SIZE],
+            )
+        )
+
+    # Edges repeated across contexts are pre-summed for the whole item: one ON CONFLICT
+    # statement cannot touch the same row twice, and overlapping contexts then cost a
+    # counter increment instead of another write.
+    for context, keys in context_keys:
+        node_ids = [node_cache[key] for key in keys]
+        node_types = {node_cache[key]: key[0] for key in keys}
+        for left, right in _edge_pairs(node_ids, node_types, full_clique=full_clique):
+            edges_created += 1
+            # Key on the raw 128-bit ints: UUID.__hash__ is a Python-level call, which
+            # dominates the quadratic full-clique loop.
+            edge_key = (left.int, right.int)
+            row = pending_edges.get(edge_key)
+            if row is not None:
+                row["strength"] += 1.0
+                row["mention_count"] += 1
+                continue
+            pending_edges[edge_key] = {
+                "user_id": item.user_id,
+                "source_node_id": left,
+                "target_node_id": right,
+                "relation_type": "co_occurs",
+                "strength": 1.0,
+                "mention_count": 1,
+                "source_item_id": item.id,
+                "source_context_id": context.id,
+            }
+    return nodes_touched, edges_created
+
+
 async def _update_memory_graph_for_item(session, item: SourceItem) -> dict[str, Any]:
     context_stmt = (
         select(ProcessedContext)
@@ -165,52 +378,41 @@ async def _update_memory_graph_for_item(session, item: SourceItem) -> dict[str,
             ProcessedContext.source_item_ids.contains([item.id]),
         )
         .order_by(ProcessedContext.created_at.asc())
+        .execution_options(yield_per=CONTEXT_STREAM_BATCH_SIZE)
     )
-    rows = await session.execute(context_stmt)
-    contexts = list(rows.scalars().all())
-    if not contexts:
-        return {"status": "skipped", "reason": "no_contexts"}
-
+    full_clique = get_settings().memory_graph_full_clique_edges
     node_cache: dict[tuple[str, str], UUID] = {}
+    pending_edges: dict[tuple[int, int], dict[str, Any]] = {}
+    context_count = 0
     edges_created = 0
     nodes_touched = 0
 
-    for context in contexts:
-        payloads = _collect_entity_payloads(context)
-        if not payloads:
-            continue
-        node_ids: list[UUID] = []
-        for payload in payloads:
-            key = (payload["node_type"], payload["name"].lower())
-            node_id = node_cache.get(key)
-            if node_id is None:
-                node_id = await _upsert_node(
-                    session,
-                    user_id=item.user_id,
-                    node_type=payload["node_type"],
-                    name=payload["name"],
-                    attributes=payload.get("attributes", {}),
-                )
-                node_cache[key] = node_id
-            node_ids.append(node_id)
-            nodes_touched += 1
-
-        unique_nodes = sorted(set(node_ids))
-        for left, right in combinations(unique_nodes, 2):
-            await _upsert_edge(
-                session,
-                user_id=item.user_id,
-                source_node_id=left,
-                target_node_id=right,
-                relation_type="co_occurs",
-                source_item_id=item.id,
-                source_context_id=context.id,
-            )
-            edges_created += 1
+    # Nodes are written per partition; edges are pre-summed across partitions and
+    # flushed whenever EDGE_FLUSH_THRESHOLD distinct edges have built up.
+    stream = await session.stream_scalars(context_stmt)
+    async for contexts in stream.partitions():
+        context_count += len(contexts)
+        touched, created = await _write_context_batch(
+            session,
+            item,
+            contexts,
+            node_cache,
+            pending_edges,
+            full_clique=full_clique,
+        )
+        nodes_touched += touched
+        edges_created += created
+        if len(pending_edges) >= EDGE_FLUSH_THRESHOLD:
+            await _upsert_edges(session, list(pending_edges.values()))
+            pending_edges.clear()
+    if pending_edges:
+        await _upsert_edges(session, list(pending_edges.values()))
 
+    if not context_count:
+        return {"status": "skipped", "reason": "no_contexts"}
     return {
         "status": "ok",
-        "contexts": len(contexts),
+        "contexts": context_count,
         "nodes_touched": nodes_touched,
         "edges_created": edges_created,
     }
@@ -235,5 +437,5 @@ def update_for_item(item_id: str) -> dict[str, Any]:
     except Exception as exc:  # pragma: no cover - validation guard
         logger.warning("Invalid item id for memory graph: {}", exc)
         return {"status": "error", "reason": "invalid_item_id"}
-    return asyncio.run(_process_item(resolved))
+    return run_async(_process_item(resolved))
 
@@ -12,19 +12,20 @@ from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..celery_app import celery_app
+from ..celery_app import celery_app, run_async
 from ..db.models import ProcessedContext, SourceItem
 from ..db.session import isolated_session
 from ..integrations.openclaw_sync import get_openclaw_sync
 from ..pipeline import run_pipeline
 from ..pipeline.utils import parse_iso_datetime
-from ..user_settings import fetch_user_settings
+from ..user_settings import fetch_user_settings_cached
+from .memory_graph import update_for_item as update_memory_graph_for_item
 
 
 async def _sync_openclaw_contexts_for_item(session: AsyncSession, item: SourceItem) -> None:
     """Sync non-episode memory contexts for an item to OpenClaw local memory files."""
     try:
-        user_settings = await fetch_user_settings(session, item.user_id)
+        user_settings = await fetch_user_settings_cached(session, item.user_id)
         openclaw_sync = get_openclaw_sync(user_settings)
         if not openclaw_sync.enabled:
             return
@@ -36,9 +37,8 @@ async def _sync_openclaw_contexts_for_item(session: AsyncSession, item: SourceIt
         )
         rows = await session.execute(stmt)
         contexts = list(rows.scalars().all())
-        synced = 0
-        for context in contexts:
-            payload = {
+        payloads = [
+            {
                 "id": str(context.id),
                 "title": context.title,
                 "summary": context.summary,
@@ -46,23 +46,31 @@ async def _sync_openclaw_contexts_for_item(session: AsyncSession, item: SourceIt
                 "context_type": context.context_type,
                 "event_time_utc": context.event_time_utc or context.start_time_utc,
             }
-            if openclaw_sync.sync_memory_entry(user_id=str(item.user_id), context=payload):
-                synced += 1
+            for context in contexts
+        ]
+        # One read/write per daily file, off the event loop.
+        synced = await asyncio.to_thread(
+            openclaw_sync.sync_memory_entries,
+            str(item.user_id),
+            payloads,
+        )
         if synced:
             logger.info("Synced {} memory context(s) for item {} to OpenClaw", synced, item.id)
     except Exception as exc:
         logger.warning("OpenClaw per-memory sync failed for item {}: {}", item.id, exc)
 
 
-async def _process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+def _parse_item_id(payload: Dict[str, Any]) -> UUID:
     try:
-        item_id = UUID(str(payload["item_id"]))
-    except (KeyError, ValueError) as exc:  # pragma: no cover - validation guard
+        return UUID(str(payload["item_id"]))
+    except (KeyError, ValueError) as exc:
         raise ValueError("process_item payload missing valid item_id") from exc
 
+
+async def _process_payload(item_id: UUID, payload: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Processing item {}", item_id)
 
-    # Use an isolated engine per task to avoid asyncpg cross-loop/concurrency issues.
+    # Workers reuse one pooled engine on their persistent loop; elsewhere this is a one-off engine.
     async with isolated_session() as session:
         item = await session.get(SourceItem, item_id)
         if item is None:
@@ -82,7 +90,7 @@ async def _process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
         await session.flush()
 
         try:
-            await run_pipeline(session, item, payload)
+            artifacts = await run_pipeline(session, item, payload)
             await _sync_openclaw_contexts_for_item(session, item)
             item.processing_status = "completed"
             item.processed_at = datetime.utcnow()
@@ -96,6 +104,10 @@ async def _process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
             logger.exception("Processing failed for item {}", item_id)
             raise
 
+    # Graph extraction runs on another worker, only after the item is committed.
+    if artifacts.get("memory_graph_pending"):
+        update_memory_graph_for_item.delay(str(item_id))
+
     return {
         "status": "completed",
         "item_id": str(item_id),
@@ -107,8 +119,10 @@ async def _process_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
 def process_item(self, payload: Dict[str, Any]) -> Dict[str, Any]:
     """Process an uploaded item into derived artifacts."""
 
+    # Validate before touching the event loop so bad payloads fail fast.
+    item_id = _parse_item_id(payload)
     try:
-        return asyncio.run(_process_payload(payload))
+        return run_async(_process_payload(item_id, payload))
     except SQLAlchemyError as exc:  # pragma: no cover - unexpected database errors
         logger.exception("Database error while processing item: {}", exc)
         raise
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import asyncio
 from datetime import date
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 from uuid import UUID
 
+from celery import group
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import and_, delete, literal_column, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
 
-from ..celery_app import celery_app
+from ..celery_app import celery_app, run_async
 from ..db.models import ProcessedContext, UserSettings
 from ..db.session import isolated_session
 from ..pipeline.utils import build_vector_text, extract_keywords
@@ -18,13 +20,34 @@ from ..recaps import resolve_week_window
 from ..vectorstore import delete_context_embeddings, upsert_context_embeddings
 
 
+WEEKLY_SUMMARY_SOURCE_LIMIT = 300
+
+# Settings rows fetched per cursor batch and recap tasks published per group.
+RECAP_FANOUT_BATCH_SIZE = 1000
+
+
+def _collect_source_items(episodes: Sequence[Any], limit: int) -> list[UUID]:
+    """Ordered, de-duplicated source item ids, stopping once ``limit`` are found."""
+    seen: set[UUID] = set()
+    collected: list[UUID] = []
+    for episode in episodes:
+        for source_id in episode.source_item_ids or ():
+            if source_id in seen:
+                continue
+            seen.add(source_id)
+            collected.append(source_id)
+            if len(collected) == limit:
+                return collected
+    return collected
+
+
 def _weekly_summary_title(start_date: date, end_date: date) -> str:
     if start_date == end_date:
         return f"Weekly recap - {start_date.isoformat()}"
     return f"Weekly recap - {start_date.isoformat()} to {end_date.isoformat()}"
 
 
-def _build_weekly_summary(episodes: list[ProcessedContext], start_date: date, end_date: date) -> tuple[str, str, list[str]]:
+def _build_weekly_summary(episodes: Sequence[Any], start_date: date, end_date: date) -> tuple[str, str, list[str]]:
     titles = []
     for episode in episodes:
         if episode.title and episode.context_type == "activity_context":
@@ -47,34 +70,49 @@ async def _generate_weekly_recap(
 ) -> dict[str, Any]:
     window = resolve_week_window(tz_name=tz_name, start_date=start_date, end_date=end_date)
     async with isolated_session() as session:
-        summary_stmt = select(ProcessedContext).where(
+        # One round trip for both the existing recap row and the week's episodes; only
+        # the columns the summary is built from are read, not vector_text/entities.
+        recap_stmt = select(
+            ProcessedContext.id,
+            ProcessedContext.context_type,
+            ProcessedContext.title,
+            ProcessedContext.source_item_ids,
+        ).where(
             ProcessedContext.user_id == user_id,
             ProcessedContext.is_episode.is_(True),
-            ProcessedContext.context_type == "weekly_summary",
-            ProcessedContext.processor_versions["weekly_summary_start"].astext == window.start_date.isoformat(),
-        )
-        summary_rows = await session.execute(summary_stmt)
-        summary_contexts = list(summary_rows.scalars().all())
-        summary_context = summary_contexts[0] if summary_contexts else None
-
-        episode_stmt = select(ProcessedContext).where(
-            ProcessedContext.user_id == user_id,
-            ProcessedContext.is_episode.is_(True),
-            ProcessedContext.context_type == "activity_context",
-            ProcessedContext.start_time_utc.is_not(None),
-            ProcessedContext.start_time_utc >= window.start_utc,
-            ProcessedContext.start_time_utc < window.end_utc,
+            or_(
+                and_(
+                    ProcessedContext.context_type == "weekly_summary",
+                    ProcessedContext.processor_versions["weekly_summary_start"].astext
+                    == window.start_date.isoformat(),
+                ),
+                and_(
+                    ProcessedContext.context_type == "activity_context",
+                    ProcessedContext.start_time_utc.is_not(None),
+                    ProcessedContext.start_time_utc >= window.start_utc,
+                    ProcessedContext.start_time_utc < window.end_utc,
+                ),
+            ),
         )
-        episode_rows = await session.execute(episode_stmt)
-        episodes = list(episode_rows.scalars().all())
+        recap_rows = await session.execute(recap_stmt)
+        summary_ids: list[UUID] = []
+        episodes: list[Any] = []
+        for row in recap_rows.all():
+            if row.context_type == "weekly_summary":
+                summary_ids.append(row.id)
+            else:
+                episodes.append(row)
 
         if not episodes:
-            if summary_contexts:
-                for context in summary_contexts:
-                    await session.delete(context)
-                await session.flush()
+            if summary_ids:
+                await session.execute(
+                    delete(ProcessedContext).where(ProcessedContext.id.in_(summary_ids))
+                )
                 try:
-                    delete_context_embeddings([str(context.id) for context in summary_contexts])
+                    await asyncio.to_thread(
+                        delete_context_embeddings,
+                        [str(context_id) for context_id in summary_ids],
+                    )
                 except Exception as exc:  # pragma: no cover - external dependency
                     logger.warning("Weekly recap embedding delete failed: {}", exc)
             await session.commit()
@@ -85,10 +123,7 @@ async def _generate_weekly_recap(
                 "reason": "no_episodes",
             }
 
-        summary_source_items: list[UUID] = []
-        for episode in episodes:
-            summary_source_items.extend(episode.source_item_ids or [])
-        summary_source_items = list(dict.fromkeys(summary_source_items))[:300]
+        summary_source_items = _collect_source_items(episodes, WEEKLY_SUMMARY_SOURCE_LIMIT)
 
         title, summary, keywords = _build_weekly_summary(episodes, window.start_date, window.end_date)
         processor_versions = {
@@ -97,45 +132,61 @@ async def _generate_weekly_recap(
             "weekly_summary_timezone": window.timezone,
         }
 
-        if summary_context is None:
-            summary_context = ProcessedContext(
+        values = {
+            "title": title,
+            "summary": summary,
+            "keywords": keywords,
+            "source_item_ids": summary_source_items,
+            "event_time_utc": window.start_utc,
+            "start_time_utc": window.start_utc,
+            "end_time_utc": window.end_utc,
+            "vector_text": build_vector_text(title, summary, keywords, context_type="weekly_summary"),
+            "processor_versions": processor_versions,
+        }
+        # Insert or refresh this week's recap in one statement, keyed on the partial
+        # unique index from migration 016.
+        summary_stmt = (
+            insert(ProcessedContext)
+            .values(
                 user_id=user_id,
                 context_type="weekly_summary",
-                title=title,
-                summary=summary,
-                keywords=keywords,
                 entities=[],
                 location={},
-                event_time_utc=window.start_utc,
-                start_time_utc=window.start_utc,
-                end_time_utc=window.end_utc,
                 is_episode=True,
-                source_item_ids=summary_source_items,
                 merged_from_context_ids=[],
-                vector_text=build_vector_text(
-                    title, summary, keywords, context_type="weekly_summary"
-                ),
-                processor_versions=processor_versions,
+                **values,
             )
-            session.add(summary_context)
-        else:
-            summary_context.title = title
-            summary_context.summary = summary
-            summary_context.keywords = keywords
-            summary_context.source_item_ids = summary_source_items
-            summary_context.event_time_utc = window.start_utc
-            summary_context.start_time_utc = window.start_utc
-            summary_context.end_time_utc = window.end_utc
-            summary_context.vector_text = build_vector_text(
-                title, summary, keywords, context_type=summary_context.context_type
+            .on_conflict_do_update(
+                index_elements=[
+                    ProcessedContext.user_id,
+                    ProcessedContext.context_type,
+                    text("(processor_versions ->> 'weekly_summary_start')"),
+                ],
+                # Literal predicate: a bound parameter can't prove the partial index applies.
+                index_where=text("context_type = 'weekly_summary'"),
+                set_=values,
             )
-            summary_context.processor_versions = processor_versions
+            .returning(ProcessedContext)
+        )
+        summary_context = await session.scalar(summary_stmt)
 
-        await session.commit()
-        try:
-            upsert_context_embeddings([summary_context])
-        except Exception as exc:  # pragma: no cover - external dependency
-            logger.warning("Weekly recap embedding upsert failed: {}", exc)
+        # The row and its id are final once RETURNING comes back, so the commit and the
+        # Qdrant write can overlap; only a failed commit fails the task, and then the
+        # vector written for the uncommitted row is removed again.
+        commit_result, upsert_result = await asyncio.gather(
+            session.commit(),
+            asyncio.to_thread(upsert_context_embeddings, [summary_context]),
+            return_exceptions=True,
+        )
+        if isinstance(commit_result, BaseException):
+            if not isinstance(upsert_result, BaseException):
+                try:
+                    await asyncio.to_thread(delete_context_embeddings, [str(summary_context.id)])
+                except Exception as exc:  # pragma: no cover - external dependency
+                    logger.warning("Weekly recap embedding delete failed: {}", exc)
+            raise commit_result
+        if isinstance(upsert_result, BaseException):  # pragma: no cover - external dependency
+            logger.warning("Weekly recap embedding upsert failed: {}", upsert_result)
 
     return {
         "status": "updated",
@@ -165,7 +216,7 @@ def weekly_recap_for_user(
             parsed_end = date.fromisoformat(end_date)
         except ValueError:
             return {"status": "invalid_end_date", "end_date": end_date}
-    return asyncio.run(
+    return run_async(
         _generate_weekly_recap(
             resolved_user,
             tz_name=tz_name,
@@ -178,22 +229,30 @@ def weekly_recap_for_user(
 @celery_app.task(name="recaps.weekly")
 def weekly_recap_batch() -> dict[str, Any]:
     async def _run() -> dict[str, Any]:
-        async with isolated_session() as session:
-            result = await session.execute(select(UserSettings.user_id, UserSettings.settings))
-            rows = result.fetchall()
-        processed = 0
         queued = 0
-        for user_id, settings in rows:
-            if not isinstance(settings, dict):
-                continue
-            notifications = settings.get("notifications") or {}
-            if not notifications.get("weeklySummary"):
-                continue
-            preferences = settings.get("preferences") or {}
-            tz_name = preferences.get("timezone")
-            weekly_recap_for_user.delay(str(user_id), tz_name=tz_name)
-            processed += 1
-            queued += 1
-        return {"status": "queued", "users": processed, "tasks": queued}
-
-    return asyncio.run(_run())
+        signatures = []
+        async with isolated_session() as session:
+            # Only opted-in users are read (partial index from migration 017), and only
+            # their timezone rather than the whole settings blob. Rows are streamed and
+            # each batch of recaps is published as soon as it fills.
+            stmt = (
+                select(
+                    UserSettings.user_id,
+                    literal_column("user_settings.settings -> 'preferences' ->> 'timezone'"),
+                )
+                .where(text("(user_settings.settings -> 'notifications' ->> 'weeklySummary') = 'true'"))
+                .execution_options(yield_per=RECAP_FANOUT_BATCH_SIZE)
+            )
+            result = await session.stream(stmt)
+            async for user_id, tz_name in result:
+                signatures.append(weekly_recap_for_user.s(str(user_id), tz_name=tz_name))
+                if len(signatures) >= RECAP_FANOUT_BATCH_SIZE:
+                    group(signatures).apply_async()
+                    queued += len(signatures)
+                    signatures = []
+        if signatures:
+            group(signatures).apply_async()
+            queued += len(signatures)
+        return {"status": "queued", "users": queued, "tasks": queued}
+
+    return run_async(_run())
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from datetime import date, datetime, time, timezone
+from functools import lru_cache
+from time import monotonic
 from typing import Any, Mapping, Optional
 from uuid import UUID
 
@@ -10,6 +13,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from zoneinfo import ZoneInfo
 
+from .cache import get_cache_value, incr_cache_value
 from .db.models import UserSettings
 
 
@@ -21,6 +25,40 @@ async def fetch_user_settings(session: AsyncSession, user_id: UUID) -> dict[str,
     return record.settings
 
 
+# Workers handle bursts of items for the same user; settings change rarely, so a short
+# per-process TTL saves a query per item. Saving settings bumps a per-user version in
+# Redis, which every worker compares before trusting its cached copy.
+USER_SETTINGS_CACHE_TTL_SECONDS = 60.0
+USER_SETTINGS_VERSION_TTL_SECONDS = 24 * 60 * 60
+_user_settings_cache: dict[UUID, tuple[dict[str, Any], float, Optional[str]]] = {}
+
+
+def _settings_version_key(user_id: UUID) -> str:
+    return f"user_settings:version:{user_id}"
+
+
+async def fetch_user_settings_cached(session: AsyncSession, user_id: UUID) -> dict[str, Any]:
+    """Return a copy of the user's settings, cached per process until TTL or a save."""
+
+    now = monotonic()
+    version = await get_cache_value(_settings_version_key(user_id))
+    cached = _user_settings_cache.get(user_id)
+    if cached is not None and cached[1] > now and cached[2] == version:
+        return deepcopy(cached[0])
+    for key in [key for key, entry in _user_settings_cache.items() if entry[1] <= now]:
+        del _user_settings_cache[key]
+    settings = await fetch_user_settings(session, user_id)
+    _user_settings_cache[user_id] = (settings, now + USER_SETTINGS_CACHE_TTL_SECONDS, version)
+    return deepcopy(settings)
+
+
+async def invalidate_user_settings_cache(user_id: UUID) -> None:
+    """Make every process drop its cached settings for ``user_id``."""
+
+    _user_settings_cache.pop(user_id, None)
+    await incr_cache_value(_settings_version_key(user_id), USER_SETTINGS_VERSION_TTL_SECONDS)
+
+
 def resolve_language_code(settings: Mapping[str, Any] | None) -> str:
     if not settings:
         return "en"
@@ -62,27 +100,41 @@ def resolve_timezone_name(settings: Mapping[str, Any] | None) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=512)
+def _tzinfo(tz_name: str) -> Optional[ZoneInfo]:
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _local_date_offset_minutes(tz_name: str, local_date: date) -> Optional[int]:
+    tzinfo = _tzinfo(tz_name)
+    if tzinfo is None:
+        return None
+    offset = datetime.combine(local_date, time.min, tzinfo=tzinfo).utcoffset()
+    if offset is None:
+        return None
+    return int(-offset.total_seconds() / 60)
+
+
 def compute_timezone_offset_minutes(
     tz_name: str,
     *,
     at: Optional[datetime] = None,
     local_date: Optional[date] = None,
 ) -> Optional[int]:
-    try:
-        tzinfo = ZoneInfo(tz_name)
-    except Exception:
-        return None
-
     if local_date:
-        local_dt = datetime.combine(local_date, time.min, tzinfo=tzinfo)
-        offset = local_dt.utcoffset()
-    else:
-        dt = at or datetime.now(timezone.utc)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        local_dt = dt.astimezone(tzinfo)
-        offset = local_dt.utcoffset()
+        return _local_date_offset_minutes(tz_name, local_date)
 
+    tzinfo = _tzinfo(tz_name)
+    if tzinfo is None:
+        return None
+    dt = at or datetime.now(timezone.utc)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    offset = dt.astimezone(tzinfo).utcoffset()
     if offset is None:
         return None
     return int(-offset.total_seconds() / 60)
@@ -118,25 +170,24 @@ async def resolve_user_tz_offset_minutes(
     return int(resolved) if resolved is not None else 0
 
 
+_FOCUS_FIELDS = (
+    ("focus_tags", "tags"),
+    ("focus_people", "people"),
+    ("focus_places", "places"),
+    ("focus_topics", "topics"),
+)
+
+
 def build_preference_guidance(settings: Mapping[str, Any] | None) -> str:
     prefs = resolve_preferences(settings)
     if not prefs:
         return ""
 
-    focus_tags = prefs.get("focus_tags") if isinstance(prefs.get("focus_tags"), list) else []
-    focus_people = prefs.get("focus_people") if isinstance(prefs.get("focus_people"), list) else []
-    focus_places = prefs.get("focus_places") if isinstance(prefs.get("focus_places"), list) else []
-    focus_topics = prefs.get("focus_topics") if isinstance(prefs.get("focus_topics"), list) else []
-
     lines: list[str] = []
-    if focus_tags:
-        lines.append(f"- Emphasize tags: {', '.join(str(t) for t in focus_tags)}.")
-    if focus_people:
-        lines.append(f"- Emphasize people: {', '.join(str(p) for p in focus_people)}.")
-    if focus_places:
-        lines.append(f"- Emphasize places: {', '.join(str(p) for p in focus_places)}.")
-    if focus_topics:
-        lines.append(f"- Emphasize topics: {', '.join(str(t) for t in focus_topics)}.")
+    for key, label in _FOCUS_FIELDS:
+        values = prefs.get(key)
+        if isinstance(values, list) and values:
+            lines.append(f"- Emphasize {label}: {', '.join(map(str, values))}.")
 
     if not lines:
         return ""
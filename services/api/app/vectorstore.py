@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 import hashlib
-import random
+import threading
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, Iterable, List, Optional
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
 from uuid import UUID
 
 from google import genai
+from google.genai import types
 from loguru import logger
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qmodels
 
+from .cache import get_cache_bytes_many, set_cache_bytes_many
 from .config import get_settings
 from .ai.usage import log_usage_from_response
 
@@ -21,7 +28,58 @@ from .ai.usage import log_usage_from_response
 @lru_cache(maxsize=1)
 def get_qdrant_client() -> QdrantClient:
     settings = get_settings()
-    return QdrantClient(url=str(settings.qdrant_url))
+    return QdrantClient(
+        url=str(settings.qdrant_url),
+        prefer_grpc=settings.qdrant_prefer_grpc,
+        grpc_port=settings.qdrant_grpc_port,
+        timeout=settings.qdrant_timeout_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_upsert_executor() -> ThreadPoolExecutor:
+    settings = get_settings()
+    return ThreadPoolExecutor(
+        max_workers=settings.qdrant_upsert_concurrency,
+        thread_name_prefix="qdrant-upsert",
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_executor() -> ThreadPoolExecutor:
+    settings = get_settings()
+    return ThreadPoolExecutor(
+        max_workers=settings.embedding_max_concurrency,
+        thread_name_prefix="embedding",
+    )
+
+
+def _chunks(values: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _upsert_points(client: QdrantClient, collection_name: str, points: list[qmodels.PointStruct]) -> None:
+    # Qdrant throughput flattens out around a few dozen points per request with a
+    # couple of requests in flight, so large upserts are split and sent concurrently.
+    # Without ``qdrant_upsert_wait`` the server acknowledges once the write is queued,
+    # so a search issued right after may briefly miss the new points.
+    settings = get_settings()
+    wait = settings.qdrant_upsert_wait
+    batches = list(_chunks(points, settings.qdrant_upsert_batch_size))
+    if len(batches) == 1:
+        client.upsert(collection_name=collection_name, points=batches[0], wait=wait)
+        return
+    futures = [
+        _get_upsert_executor().submit(
+            client.upsert, collection_name=collection_name, points=batch, wait=wait
+        )
+        for batch in batches
+    ]
+    for future in futures:
+        future.result()
+
 
 def _extract_collection_size(info: Any) -> Optional[int]:
     config = getattr(info, "config", None)
@@ -40,17 +98,37 @@ def _extract_collection_size(info: Any) -> Optional[int]:
     return None
 
 
+# Collections (and vector sizes) already verified by this process; once a collection
+# exists it is never dropped at runtime, so the check is not repeated.
+_ENSURED_COLLECTIONS: set[tuple[str, int]] = set()
+_DEFAULT_INDEXING_THRESHOLD = 20000
+_ENSURE_LOCK = threading.Lock()
+
+
 def ensure_collection(vector_size: int) -> None:
     settings = get_settings()
+    key = (settings.qdrant_collection, vector_size)
+    if key in _ENSURED_COLLECTIONS:
+        return
+    # Embedding and search calls run on worker threads; serialize the first check so
+    # two threads cannot both try to create the collection.
+    with _ENSURE_LOCK:
+        if key in _ENSURED_COLLECTIONS:
+            return
+        _ensure_collection(settings.qdrant_collection, vector_size)
+        _ENSURED_COLLECTIONS.add(key)
+
+
+def _ensure_collection(collection_name: str, vector_size: int) -> None:
     client = get_qdrant_client()
-    if not client.collection_exists(settings.qdrant_collection):
+    if not client.collection_exists(collection_name):
         logger.info(
             "Creating Qdrant collection {} (dim={})",
-            settings.qdrant_collection,
+            collection_name,
             vector_size,
         )
         client.create_collection(
-            collection_name=settings.qdrant_collection,
+            collection_name=collection_name,
             vectors_config=qmodels.VectorParams(
                 size=vector_size,
                 distance=qmodels.Distance.COSINE,
@@ -58,20 +136,50 @@ def ensure_collection(vector_size: int) -> None:
         )
         return
     try:
-        info = client.get_collection(settings.qdrant_collection)
+        info = client.get_collection(collection_name)
     except Exception:
         return
     existing_size = _extract_collection_size(info)
     if existing_size and existing_size != vector_size:
         raise RuntimeError(
-            f"Qdrant collection {settings.qdrant_collection} size mismatch "
+            f"Qdrant collection {collection_name} size mismatch "
             f"(expected {vector_size}, found {existing_size})."
         )
 
 
-def _deterministic_vector(seed: int, size: int) -> List[float]:
-    rng = random.Random(seed)
-    return [rng.random() for _ in range(size)]
+@contextmanager
+def bulk_ingest() -> Iterator[None]:
+    """Pause HNSW indexing on the context collection while a backfill rewrites it.
+
+    Points written inside the block are stored unindexed (searches still work, by
+    brute force over the new segments); the previous indexing threshold is restored on
+    exit and Qdrant builds the index once for the whole batch.
+    """
+
+    settings = get_settings()
+    client = get_qdrant_client()
+    collection_name = settings.qdrant_collection
+    if not client.collection_exists(collection_name):
+        yield
+        return
+    info = client.get_collection(collection_name)
+    optimizer_config = getattr(info.config, "optimizer_config", None)
+    previous_threshold = getattr(optimizer_config, "indexing_threshold", None)
+    client.update_collection(
+        collection_name=collection_name,
+        optimizers_config=qmodels.OptimizersConfigDiff(indexing_threshold=0),
+    )
+    try:
+        yield
+    finally:
+        client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=qmodels.OptimizersConfigDiff(
+                indexing_threshold=previous_threshold
+                if previous_threshold is not None
+                else _DEFAULT_INDEXING_THRESHOLD
+            ),
+        )
 
 
 @lru_cache(maxsize=1)
@@ -79,7 +187,10 @@ def _get_genai_client() -> genai.Client:
     settings = get_settings()
     if not settings.gemini_api_key:
         raise RuntimeError("GEMINI_API_KEY is required for embedding requests.")
-    return genai.Client(api_key=settings.gemini_api_key)
+    return genai.Client(
+        api_key=settings.gemini_api_key,
+        http_options=types.HttpOptions(timeout=settings.embedding_timeout_seconds * 1000),
+    )
 
 
 def _extract_embedding_values(embedding: Any) -> List[float]:
@@ -97,8 +208,21 @@ def _extract_embedding_values(embedding: Any) -> List[float]:
     raise ValueError("Unable to parse embedding values from response")
 
 
+_embedding_values = attrgetter("values")
+
+
 def _extract_embeddings(response: Any) -> List[List[float]]:
     embeddings = getattr(response, "embeddings", None)
+    if isinstance(embeddings, list):
+        # google-genai returns ContentEmbedding objects with a ``values`` list; read them
+        # in one C-level pass and only fall back to probing on other shapes.
+        try:
+            values = list(map(_embedding_values, embeddings))
+        except AttributeError:
+            pass
+        else:
+            if all(isinstance(value, list) for value in values):
+                return values
     if embeddings is None:
         embeddings = getattr(response, "embedding", None)
     if embeddings is None:
@@ -108,10 +232,36 @@ def _extract_embeddings(response: Any) -> List[List[float]]:
     return [_extract_embedding_values(embeddings)]
 
 
+@lru_cache(maxsize=256)
+def _deterministic_text_array(text: str, size: int) -> np.ndarray:
+    # Cached as float32 (~12 KB at 3072 dims) and read-only; callers get a fresh list.
+    array = _text_generator(text).random(size, dtype=np.float32)
+    array.setflags(write=False)
+    return array
+
+
 def _deterministic_text_vector(text: str, size: int) -> List[float]:
-    digest = hashlib.sha256(text.encode("utf-8")).digest()
-    seed = int.from_bytes(digest[:8], "big", signed=False)
-    return _deterministic_vector(seed, size)
+    return _deterministic_text_array(text, size).tolist()
+
+
+def _text_generator(text: str) -> np.random.Generator:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+    return np.random.Generator(np.random.PCG64(int.from_bytes(digest, "big", signed=False)))
+
+
+def _deterministic_text_vectors(texts: List[str], size: int) -> List[List[float]]:
+    """Batch form of ``_deterministic_text_vector``: same values, one matrix."""
+    unique_texts = list(dict.fromkeys(texts))
+    matrix = np.empty((len(unique_texts), size), dtype=np.float32)
+    for row, text in enumerate(unique_texts):
+        _text_generator(text).random(dtype=np.float32, out=matrix[row])
+    by_text = dict(zip(unique_texts, matrix.tolist()))
+    return [list(by_text[text]) for text in texts]
+
+
+def _embedding_cache_key(model: str, text: str) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"embedding:{model}:{digest}"
 
 
 def embed_texts(
@@ -123,17 +273,39 @@ def embed_texts(
 ) -> List[List[float]]:
     settings = get_settings()
     if settings.embedding_provider == "none":
-        return [_deterministic_text_vector(text, settings.embedding_dimension) for text in texts]
+        if len(texts) == 1:
+            return [_deterministic_text_vector(texts[0], settings.embedding_dimension)]
+        return _deterministic_text_vectors(texts, settings.embedding_dimension)
+
+    ttl_seconds = settings.embedding_cache_ttl_seconds
+    cache_keys = (
+        [_embedding_cache_key(settings.embedding_model, text) for text in texts]
+        if ttl_seconds > 0
+        else []
+    )
+    cached = get_cache_bytes_many(cache_keys) if cache_keys else [None] * len(texts)
+    vectors: List[Optional[List[float]]] = [
+        np.frombuffer(raw, dtype=np.float32).tolist() if raw else None for raw in cached
+    ]
+    # Only texts missing from the cache are sent, each at most once per call.
+    pending = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+    if not pending:
+        return vectors
 
     client = _get_genai_client()
-    vectors: List[List[float]] = []
-    batch_size = settings.embedding_batch_size
-    for start in range(0, len(texts), batch_size):
-        batch = texts[start : start + batch_size]
-        response = client.models.embed_content(
-            model=settings.embedding_model,
-            contents=batch,
-        )
+    embedded: Dict[str, List[float]] = {}
+    batches = list(_chunks(pending, settings.embedding_batch_size))
+
+    def _embed_batch(batch: list[str]) -> Any:
+        return client.models.embed_content(model=settings.embedding_model, contents=batch)
+
+    # Embedding calls are network-bound; keep a few batches in flight and consume the
+    # responses in order so usage logging and result assembly stay on this thread.
+    if len(batches) == 1:
+        responses: Iterable[Any] = [_embed_batch(batches[0])]
+    else:
+        responses = _get_embedding_executor().map(_embed_batch, batches)
+    for batch, response in zip(batches, responses):
         log_usage_from_response(
             response,
             user_id=user_id,
@@ -145,8 +317,18 @@ def embed_texts(
         embeddings = _extract_embeddings(response)
         if len(embeddings) != len(batch):
             raise RuntimeError("Embedding response length mismatch.")
-        vectors.extend(embeddings)
-    return vectors
+        embedded.update(zip(batch, embeddings))
+
+    if cache_keys:
+        key_by_text = dict(zip(texts, cache_keys))
+        set_cache_bytes_many(
+            {
+                key_by_text[text]: np.asarray(vector, dtype=np.float32).tobytes()
+                for text, vector in embedded.items()
+            },
+            ttl_seconds,
+        )
+    return [vector if vector is not None else embedded[text] for text, vector in zip(texts, vectors)]
 
 
 def embed_text(
@@ -159,25 +341,43 @@ def embed_text(
     return embed_texts([text], user_id=user_id, item_id=item_id, step_name=step_name)[0]
 
 
+def _context_point(context: Any, vector: List[float]) -> qmodels.PointStruct:
+    context_id = str(context.id)
+    event_time = context.event_time_utc
+    payload = {
+        "context_id": context_id,
+        "user_id": str(context.user_id),
+        "context_type": context.context_type,
+        "is_episode": bool(context.is_episode),
+        "title": context.title,
+        "summary": context.summary,
+        "keywords": context.keywords,
+        "event_time_utc": event_time.isoformat() if event_time else None,
+        "event_time_unix": event_time.timestamp() if event_time else None,
+        "source_item_ids": list(map(str, context.source_item_ids or ())),
+        "entities": context.entities,
+    }
+    return qmodels.PointStruct(id=context_id, vector=vector, payload=payload)
+
+
 def upsert_context_embeddings(contexts: Iterable[Any]) -> None:
     """Insert embeddings for processed contexts."""
 
     settings = get_settings()
     client = get_qdrant_client()
-    points: list[qmodels.PointStruct] = []
     vector_texts: list[str] = []
+    unique_user_ids = set()
+    unique_source_ids = set()
     context_list = list(contexts)
     for context in context_list:
-        vector_texts.append(getattr(context, "vector_text", "") or "")
+        vector_texts.append(context.vector_text or "")
+        unique_user_ids.add(context.user_id)
+        source_ids = context.source_item_ids
+        if isinstance(source_ids, list):
+            unique_source_ids.update(source_ids)
     if not vector_texts:
         return
-    unique_user_ids = {getattr(context, "user_id", None) for context in context_list}
     resolved_user = next(iter(unique_user_ids)) if len(unique_user_ids) == 1 else None
-    unique_source_ids = set()
-    for context in context_list:
-        source_ids = getattr(context, "source_item_ids", None)
-        if isinstance(source_ids, list):
-            unique_source_ids.update(source_ids)
     resolved_item = next(iter(unique_source_ids)) if len(unique_source_ids) == 1 else None
     vectors = embed_texts(
         vector_texts,
@@ -193,35 +393,11 @@ def upsert_context_embeddings(contexts: Iterable[Any]) -> None:
             settings.embedding_dimension,
             vector_size,
         )
-    for context, vector in zip(context_list, vectors):
-        payload = {
-            "context_id": str(context.id),
-            "user_id": str(context.user_id),
-            "context_type": getattr(context, "context_type", None),
-            "is_episode": bool(getattr(context, "is_episode", False)),
-            "title": getattr(context, "title", None),
-            "summary": getattr(context, "summary", None),
-            "keywords": getattr(context, "keywords", []),
-            "event_time_utc": getattr(context, "event_time_utc", None).isoformat()
-            if getattr(context, "event_time_utc", None)
-            else None,
-            "event_time_unix": getattr(context, "event_time_utc", None).timestamp()
-            if getattr(context, "event_time_utc", None)
-            else None,
-            "source_item_ids": [str(value) for value in getattr(context, "source_item_ids", [])],
-            "entities": getattr(context, "entities", []),
-        }
-        points.append(
-            qmodels.PointStruct(id=str(context.id), vector=vector, payload=payload)
-        )
+    points = list(map(_context_point, context_list, vectors))
     if not points:
         return
     logger.info("Upserting {} context embeddings", len(points))
-    client.upsert(
-        collection_name=settings.qdrant_collection,
-        points=points,
-        wait=True,
-    )
+    _upsert_points(client, settings.qdrant_collection, points)
 
 
 def _build_filter(
@@ -288,6 +464,134 @@ def _build_filter(
     return qmodels.Filter(must=must)
 
 
+class _SearchEmbeddingBatcher:
+    """Coalesce concurrent single-query search embeddings into shared calls.
+
+    Searches are batched per user, so each batch is one embed_texts call with unchanged
+    usage attribution and different users never wait on each other. The first pending
+    search for a user leads its batch: if that user already has a batch being embedded,
+    it keeps the new batch open until that call returns, the batch fills, or the coalesce
+    window passes; otherwise it embeds immediately.
+
+    Async routes and tasks reach this through asyncio.to_thread, so it runs on pool
+    threads with no event loop; usage rows logged here are handed back to the loop
+    that owns the DB pool (see app.ai.usage).
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._pending: Dict[Optional[str], list[tuple[str, Future]]] = {}
+        self._in_flight: Dict[Optional[str], int] = {}
+
+    def embed(self, text: str, user_id: Optional[str], window: float, max_size: int) -> List[float]:
+        future: Future = Future()
+        with self._cond:
+            pending = self._pending.setdefault(user_id, [])
+            pending.append((text, future))
+            leader = len(pending) == 1
+            if len(pending) >= max_size:
+                self._cond.notify_all()
+            if leader:
+                if self._in_flight.get(user_id):
+                    self._cond.wait_for(
+                        lambda: not self._in_flight.get(user_id) or len(self._pending[user_id]) >= max_size,
+                        timeout=window,
+                    )
+                batch = self._pending.pop(user_id)
+                self._in_flight[user_id] = self._in_flight.get(user_id, 0) + 1
+        if leader:
+            try:
+                self._run(batch, user_id)
+            finally:
+                with self._cond:
+                    self._in_flight[user_id] -= 1
+                    if not self._in_flight[user_id]:
+                        del self._in_flight[user_id]
+                    self._cond.notify_all()
+        return future.result()
+
+    @staticmethod
+    def _run(batch: list[tuple[str, Future]], user_id: Optional[str]) -> None:
+        try:
+            vectors = embed_texts(
+                [text for text, _ in batch],
+                user_id=user_id,
+                step_name="search_embedding",
+            )
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            # Followers block on future.result(); never leave one unresolved.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Search embedding batch did not complete."))
+
+
+_SEARCH_EMBEDDING_BATCHER = _SearchEmbeddingBatcher()
+
+
+def _embed_search_query(query: str, user_id: Optional[str]) -> List[float]:
+    settings = get_settings()
+    if settings.embedding_provider == "none" or settings.search_embed_coalesce_ms <= 0:
+        return embed_text(query, user_id=user_id, step_name="search_embedding")
+    return _SEARCH_EMBEDDING_BATCHER.embed(
+        query,
+        user_id,
+        settings.search_embed_coalesce_ms / 1000,
+        settings.embedding_batch_size,
+    )
+
+
+def _query_contexts(
+    vectors: Sequence[List[float]],
+    limit: int,
+    user_id: Optional[str],
+    **filters: Any,
+) -> List[List[Dict[str, Any]]]:
+    settings = get_settings()
+    client = get_qdrant_client()
+    ensure_collection(len(vectors[0]))
+    query_filter = _build_filter(user_id, **filters)
+    if len(vectors) == 1:
+        responses = [
+            client.query_points(
+                collection_name=settings.qdrant_collection,
+                query=vectors[0],
+                limit=limit,
+                with_payload=True,
+                query_filter=query_filter,
+            )
+        ]
+    else:
+        responses = client.query_batch_points(
+            collection_name=settings.qdrant_collection,
+            requests=[
+                qmodels.QueryRequest(
+                    query=vector,
+                    limit=limit,
+                    with_payload=True,
+                    filter=query_filter,
+                )
+                for vector in vectors
+            ],
+        )
+    return [
+        [
+            {
+                "context_id": point.payload.get("context_id") or str(point.id),
+                "score": point.score,
+                "payload": point.payload,
+            }
+            for point in response.points
+        ]
+        for response in responses
+    ]
+
+
 def search_contexts(
     query: str,
     limit: int = 5,
@@ -300,31 +604,42 @@ def search_contexts(
 ) -> List[Dict[str, Any]]:
     """Query Qdrant using the configured embedding model."""
 
-    settings = get_settings()
-    client = get_qdrant_client()
-    vector = embed_text(query, user_id=user_id, step_name="search_embedding")
-    ensure_collection(len(vector))
-    results = client.query_points(
-        collection_name=settings.qdrant_collection,
-        query=vector,
-        limit=limit,
-        with_payload=True,
-        query_filter=_build_filter(
-            user_id,
-            is_episode=is_episode,
-            context_type=context_type,
-            start_time=start_time,
-            end_time=end_time,
-        ),
+    vector = _embed_search_query(query, user_id)
+    return _query_contexts(
+        [vector],
+        limit,
+        user_id,
+        is_episode=is_episode,
+        context_type=context_type,
+        start_time=start_time,
+        end_time=end_time,
+    )[0]
+
+
+def search_contexts_batch(
+    queries: Sequence[str],
+    limit: int = 5,
+    user_id: Optional[str] = None,
+    *,
+    is_episode: Optional[bool] = None,
+    context_type: Optional[str] = None,
+    start_time: Optional[datetime | str] = None,
+    end_time: Optional[datetime | str] = None,
+) -> List[List[Dict[str, Any]]]:
+    """Run several queries with one embedding call and one Qdrant round-trip."""
+
+    if not queries:
+        return []
+    vectors = embed_texts(list(queries), user_id=user_id, step_name="search_embedding")
+    return _query_contexts(
+        vectors,
+        limit,
+        user_id,
+        is_episode=is_episode,
+        context_type=context_type,
+        start_time=start_time,
+        end_time=end_time,
     )
-    return [
-        {
-            "context_id": point.payload.get("context_id") or str(point.id),
-            "score": point.score,
-            "payload": point.payload,
-        }
-        for point in results.points
-    ]
 
 
 def delete_context_embeddings(context_ids: Iterable[str]) -> None:
@@ -333,20 +648,24 @@ def delete_context_embeddings(context_ids: Iterable[str]) -> None:
     ids = [str(context_id) for context_id in context_ids if context_id]
     if not ids:
         return
-    if not client.collection_exists(settings.qdrant_collection):
-        return
+    if not any(name == settings.qdrant_collection for name, _ in _ENSURED_COLLECTIONS):
+        if not client.collection_exists(settings.qdrant_collection):
+            return
     client.delete(
         collection_name=settings.qdrant_collection,
         points_selector=qmodels.PointIdsList(points=ids),
-        wait=True,
+        # Deletes are applied in order with later writes; no need to block on them.
+        wait=False,
     )
 
 
 __all__ = [
     "get_qdrant_client",
     "ensure_collection",
+    "bulk_ingest",
     "embed_text",
     "upsert_context_embeddings",
     "search_contexts",
+    "search_contexts_batch",
     "delete_context_embeddings",
 ]
@@ -0,0 +1,11 @@
+-- 014_processed_contexts_source_items_gin.sql
+-- Indexes the per-item context lookup (source_item_ids @> ARRAY[item_id]) used by
+-- memory graph updates and OpenClaw sync, which otherwise scans all user contexts.
+-- Migrations run inside a transaction, so these cannot use CREATE INDEX CONCURRENTLY.
+
+CREATE INDEX IF NOT EXISTS processed_contexts_source_item_ids_gin_idx
+    ON processed_contexts USING GIN (source_item_ids);
+
+CREATE INDEX IF NOT EXISTS processed_contexts_user_non_episode_idx
+    ON processed_contexts (user_id, created_at)
+    WHERE is_episode IS FALSE;
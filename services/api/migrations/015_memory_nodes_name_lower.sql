@@ -0,0 +1,73 @@
+-- Match memory nodes case-insensitively: key uniqueness on a stored lower(name).
+ALTER TABLE memory_nodes
+    ADD COLUMN IF NOT EXISTS name_lower TEXT GENERATED ALWAYS AS (lower(name)) STORED;
+
+-- Fold nodes that differ only in case into the earliest one before the new
+-- unique index is built.
+CREATE TEMP TABLE _memory_node_merge ON COMMIT DROP AS
+SELECT id AS dup_id, keep_id
+FROM (
+    SELECT
+        id,
+        first_value(id) OVER (
+            PARTITION BY user_id, node_type, name_lower
+            ORDER BY first_seen, id
+        ) AS keep_id
+    FROM memory_nodes
+) ranked
+WHERE id <> keep_id;
+
+UPDATE memory_nodes AS node
+SET mention_count = node.mention_count + merged.mention_count,
+    last_seen = GREATEST(node.last_seen, merged.last_seen)
+FROM (
+    SELECT m.keep_id, SUM(d.mention_count) AS mention_count, MAX(d.last_seen) AS last_seen
+    FROM _memory_node_merge m
+    JOIN memory_nodes d ON d.id = m.dup_id
+    GROUP BY m.keep_id
+) merged
+WHERE node.id = merged.keep_id;
+
+-- Edges are undirected and stored as (min id, max id) by the app, so re-pointed
+-- endpoints are re-ordered the same way before being grouped.
+CREATE TEMP TABLE _memory_edge_merge ON COMMIT DROP AS
+SELECT
+    e.user_id,
+    LEAST(COALESCE(ms.keep_id, e.source_node_id), COALESCE(mt.keep_id, e.target_node_id))
+        AS source_node_id,
+    GREATEST(COALESCE(ms.keep_id, e.source_node_id), COALESCE(mt.keep_id, e.target_node_id))
+        AS target_node_id,
+    e.relation_type,
+    SUM(e.strength) AS strength,
+    SUM(e.mention_count) AS mention_count,
+    MAX(e.last_connected) AS last_connected,
+    (ARRAY_AGG(e.source_item_id ORDER BY e.last_connected))[1] AS source_item_id,
+    (ARRAY_AGG(e.source_context_id ORDER BY e.last_connected))[1] AS source_context_id
+FROM memory_edges e
+LEFT JOIN _memory_node_merge ms ON ms.dup_id = e.source_node_id
+LEFT JOIN _memory_node_merge mt ON mt.dup_id = e.target_node_id
+WHERE ms.dup_id IS NOT NULL OR mt.dup_id IS NOT NULL
+GROUP BY 1, 2, 3, 4;
+
+-- Edges on the duplicates go with them (ON DELETE CASCADE) and are re-added below.
+DELETE FROM memory_nodes WHERE id IN (SELECT dup_id FROM _memory_node_merge);
+
+INSERT INTO memory_edges (
+    user_id, source_node_id, target_node_id, relation_type,
+    strength, mention_count, last_connected, source_item_id, source_context_id
+)
+SELECT
+    user_id, source_node_id, target_node_id, relation_type,
+    strength, mention_count, last_connected, source_item_id, source_context_id
+FROM _memory_edge_merge
+WHERE source_node_id <> target_node_id
+ON CONFLICT (user_id, source_node_id, target_node_id, relation_type) DO UPDATE SET
+    strength = memory_edges.strength + EXCLUDED.strength,
+    mention_count = memory_edges.mention_count + EXCLUDED.mention_count,
+    last_connected = GREATEST(memory_edges.last_connected, EXCLUDED.last_connected);
+
+ALTER TABLE memory_nodes DROP CONSTRAINT IF EXISTS memory_nodes_user_id_node_type_name_key;
+ALTER TABLE memory_nodes DROP CONSTRAINT IF EXISTS memory_nodes_user_type_name_idx;
+
+CREATE UNIQUE INDEX IF NOT EXISTS memory_nodes_user_type_name_lower_idx
+    ON memory_nodes (user_id, node_type, name_lower);
@@ -0,0 +1,15 @@
+-- 016_weekly_summary_unique.sql
+-- One weekly recap row per user and week so recaps can be written with a single upsert.
+
+DELETE FROM processed_contexts AS dup
+USING processed_contexts AS keep
+WHERE dup.context_type = 'weekly_summary'
+  AND keep.context_type = 'weekly_summary'
+  AND dup.user_id = keep.user_id
+  AND (dup.processor_versions ->> 'weekly_summary_start')
+      = (keep.processor_versions ->> 'weekly_summary_start')
+  AND (dup.created_at, dup.id) < (keep.created_at, keep.id);
+
+CREATE UNIQUE INDEX IF NOT EXISTS processed_contexts_weekly_summary_start_idx
+    ON processed_contexts (user_id, context_type, (processor_versions ->> 'weekly_summary_start'))
+    WHERE context_type = 'weekly_summary';
@@ -0,0 +1,6 @@
+-- 017_user_settings_weekly_summary_idx.sql
+-- Lets the weekly recap fan-out scan only users who opted into weekly summaries.
+
+CREATE INDEX IF NOT EXISTS user_settings_weekly_summary_idx
+    ON user_settings (user_id)
+    WHERE (settings -> 'notifications' ->> 'weeklySummary') = 'true';
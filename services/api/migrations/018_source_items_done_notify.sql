@@ -0,0 +1,21 @@
+-- 018_source_items_done_notify.sql
+-- Publish NOTIFY source_item_done, '<item id>' when an item reaches a terminal status,
+-- so clients waiting on processing can LISTEN instead of polling. Postgres delivers the
+-- notification only when the updating transaction commits.
+
+CREATE OR REPLACE FUNCTION notify_source_item_done() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('source_item_done', NEW.id::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS source_items_done_notify ON source_items;
+CREATE TRIGGER source_items_done_notify
+    AFTER UPDATE OF processing_status ON source_items
+    FOR EACH ROW
+    WHEN (
+        NEW.processing_status IN ('completed', 'failed')
+        AND OLD.processing_status IS DISTINCT FROM NEW.processing_status
+    )
+    EXECUTE FUNCTION notify_source_item_done();
@@ -23,7 +23,7 @@ import os
 from pathlib import Path
 import random
 import uuid
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from urllib.parse import quote
 
 import httpx
@@ -32,7 +32,11 @@ import httpx
 DEFAULT_TEST_USER_ID = "00000000-0000-0000-0000-000000000001"
 PHOTO_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".heic", ".heif"}
 VIDEO_EXTS = {".mp4", ".mov", ".m4v", ".webm"}
+MEDIA_EXTS = PHOTO_EXTS | VIDEO_EXTS
 ITEM_TYPES = ("photo", "video")
+# Files at or above this size are streamed from disk instead of read into memory.
+STREAM_UPLOAD_MIN_BYTES = 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1024 * 1024
 
 EXT_CONTENT_TYPES = {
     ".heic": "image/heic",
@@ -63,6 +67,15 @@ KEYWORD_CATEGORIES = {
     "social": {"friends", "social", "group", "hangout", "picnic", "family"},
 }
 
+CATEGORY_ORDER = list(KEYWORD_CATEGORIES)
+# keyword -> index of the first category listing it (built in reverse so earlier
+# categories overwrite later ones), for one dict lookup per token.
+KEYWORD_RANKS: Dict[str, int] = {
+    keyword: rank
+    for rank, keywords in reversed(list(enumerate(KEYWORD_CATEGORIES.values())))
+    for keyword in keywords
+}
+
 
 CATEGORY_DAY_WEIGHTS = {
     "commute": 0.9,
@@ -235,20 +248,46 @@ def parse_args() -> argparse.Namespace:
         default=30.0,
         help="HTTP client timeout in seconds for API/storage requests.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="How many files to upload at the same time (default: 8).",
+    )
     return parser.parse_args()
 
 
+def iter_media_files(root: Path) -> Iterator[Path]:
+    """Walk ``root`` yielding supported media files.
+
+    Uses ``os.scandir`` so the directory read already tells us entry types, and checks
+    the extension before any further stat, so non-media files cost nothing extra.
+    Like ``rglob``, symlinked directories are not followed and unreadable ones skipped.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif os.path.splitext(entry.name)[1].lower() in MEDIA_EXTS and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 def gather_files(paths: Sequence[Path]) -> List[Path]:
     collected: List[Path] = []
     seen: set[Path] = set()
     for path in paths:
         if path.is_dir():
-            for candidate in path.rglob("*"):
-                if candidate.is_file():
-                    resolved = candidate.resolve()
-                    if resolved not in seen:
-                        collected.append(candidate)
-                        seen.add(resolved)
+            for candidate in iter_media_files(path):
+                resolved = candidate.resolve()
+                if resolved not in seen:
+                    collected.append(candidate)
+                    seen.add(resolved)
         elif path.is_file():
             resolved = path.resolve()
             if resolved not in seen:
@@ -272,10 +311,9 @@ def classify_item(path: Path) -> Optional[Tuple[str, str]]:
 def guess_category(path: Path) -> str:
     tokens = [path.stem.lower()]
     tokens.extend(part.lower() for part in path.parts)
-    for category, keywords in KEYWORD_CATEGORIES.items():
-        if any(token in keywords for token in tokens):
-            return category
-    return "misc"
+    # Earlier categories win when tokens match several, as in KEYWORD_CATEGORIES order.
+    ranks = [KEYWORD_RANKS[token] for token in tokens if token in KEYWORD_RANKS]
+    return CATEGORY_ORDER[min(ranks)] if ranks else "misc"
 
 
 def build_date_buckets(today: date, weeks: int) -> Tuple[List[date], List[date]]:
@@ -374,20 +412,46 @@ async def request_upload_url(
     return resp.json()
 
 
-async def upload_bytes(upload_meta: Dict[str, Any], data: bytes, content_type: str, timeout: float) -> None:
+async def iter_file_chunks(path: Path, chunk_size: int = UPLOAD_CHUNK_BYTES) -> AsyncIterator[bytes]:
+    with path.open("rb") as handle:
+        while chunk := await asyncio.to_thread(handle.read, chunk_size):
+            yield chunk
+
+
+def open_upload_body(path: Path, size_bytes: int) -> Union[bytes, AsyncIterator[bytes]]:
+    """Small files are read whole; larger ones (videos) are streamed in chunks."""
+    if size_bytes < STREAM_UPLOAD_MIN_BYTES:
+        return path.read_bytes()
+    return iter_file_chunks(path)
+
+
+async def upload_bytes(
+    storage_client: httpx.AsyncClient,
+    upload_meta: Dict[str, Any],
+    data: Union[bytes, AsyncIterator[bytes]],
+    size_bytes: int,
+    content_type: str,
+) -> None:
     url = upload_meta.get("url")
     if not url:
         raise RuntimeError("Upload URL not provided by storage provider; configure Supabase for this script.")
 
     headers = upload_meta.get("headers", {}).copy()
     headers.setdefault("Content-Type", content_type)
+    # Presigned PUTs reject chunked transfer encoding, so streamed bodies need a length.
+    headers["Content-Length"] = str(size_bytes)
 
-    async with httpx.AsyncClient(timeout=timeout) as storage_client:
-        response = await storage_client.put(url, content=data, headers=headers)
-        response.raise_for_status()
+    response = await storage_client.put(url, content=data, headers=headers)
+    response.raise_for_status()
 
 
-async def upload_bytes_supabase(key: str, data: bytes, content_type: str, timeout: float) -> None:
+async def upload_bytes_supabase(
+    storage_client: httpx.AsyncClient,
+    key: str,
+    data: Union[bytes, AsyncIterator[bytes]],
+    size_bytes: int,
+    content_type: str,
+) -> None:
     supabase_url = os.environ.get("SUPABASE_URL")
     service_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
     bucket = (os.environ.get("BUCKET_ORIGINALS") or "originals").strip()
@@ -400,11 +464,43 @@ async def upload_bytes_supabase(key: str, data: bytes, content_type: str, timeou
         "apikey": service_key,
         "Authorization": f"Bearer {service_key}",
         "Content-Type": content_type,
+        "Content-Length": str(size_bytes),
         "x-upsert": "true",
     }
-    async with httpx.AsyncClient(timeout=timeout) as storage_client:
-        response = await storage_client.post(url, content=data, headers=headers)
-        response.raise_for_status()
+    response = await storage_client.post(url, content=data, headers=headers)
+    response.raise_for_status()
+
+
+async def upload_item(
+    api_client: httpx.AsyncClient,
+    storage_client: httpx.AsyncClient,
+    item: PlannedItem,
+    args: argparse.Namespace,
+    js_offset: int,
+) -> Dict[str, Any]:
+    size_bytes = item.file.stat().st_size
+    if args.direct_upload:
+        storage_key = f"{args.prefix}/{uuid.uuid4()}-{item.file.name}"
+        print(f"Uploading {item.file.name} ({size_bytes} bytes) -> {storage_key}")
+        body = await asyncio.to_thread(open_upload_body, item.file, size_bytes)
+        await upload_bytes_supabase(storage_client, storage_key, body, size_bytes, item.content_type)
+    else:
+        upload_meta = await request_upload_url(api_client, item.file.name, item.content_type, args.prefix)
+        body = await asyncio.to_thread(open_upload_body, item.file, size_bytes)
+        await upload_bytes(storage_client, upload_meta, body, size_bytes, item.content_type)
+        storage_key = upload_meta["key"]
+
+    return {
+        "storage_key": storage_key,
+        "item_type": item.item_type,
+        "provider": args.provider,
+        "captured_at": item.captured_at.isoformat(),
+        "content_type": item.content_type,
+        "original_filename": item.file.name,
+        "size_bytes": size_bytes,
+        "client_tz_offset_minutes": js_offset,
+        "event_time_override": args.event_time_override,
+    }
 
 
 def chunked(items: Sequence[Any], size: int) -> Iterable[List[Any]]:
@@ -435,32 +531,21 @@ async def main() -> None:
     if args.auth_token:
         headers["Authorization"] = f"Bearer {args.auth_token}"
 
-    ingest_items: List[Dict[str, Any]] = []
-    async with httpx.AsyncClient(base_url=args.api_url.rstrip("/"), timeout=args.http_timeout, headers=headers) as api_client:
-        for item in planned:
-            file_bytes = item.file.read_bytes()
-            if args.direct_upload:
-                storage_key = f"{args.prefix}/{uuid.uuid4()}-{item.file.name}"
-                print(f"Uploading {item.file.name} ({len(file_bytes)} bytes) -> {storage_key}")
-                await upload_bytes_supabase(storage_key, file_bytes, item.content_type, args.http_timeout)
-            else:
-                upload_meta = await request_upload_url(api_client, item.file.name, item.content_type, args.prefix)
-                await upload_bytes(upload_meta, file_bytes, item.content_type, args.http_timeout)
-                storage_key = upload_meta["key"]
-
-            ingest_items.append(
-                {
-                    "storage_key": storage_key,
-                    "item_type": item.item_type,
-                    "provider": args.provider,
-                    "captured_at": item.captured_at.isoformat(),
-                    "content_type": item.content_type,
-                    "original_filename": item.file.name,
-                    "size_bytes": item.file.stat().st_size,
-                    "client_tz_offset_minutes": js_offset,
-                    "event_time_override": args.event_time_override,
-                }
-            )
+    concurrency = max(1, args.concurrency)
+    # One pooled client for all storage uploads so each file reuses a warm connection
+    # instead of paying DNS + TCP + TLS setup again.
+    storage_limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.api_url.rstrip("/"), timeout=args.http_timeout, headers=headers
+    ) as api_client, httpx.AsyncClient(timeout=args.http_timeout, limits=storage_limits) as storage_client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_upload(item: PlannedItem) -> Dict[str, Any]:
+            async with semaphore:
+                return await upload_item(api_client, storage_client, item, args, js_offset)
+
+        # gather keeps results in planned (captured_at) order regardless of finish order.
+        ingest_items = list(await asyncio.gather(*(bounded_upload(item) for item in planned)))
 
         accepted = 0
         failed = 0
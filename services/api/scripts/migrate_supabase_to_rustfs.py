@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import os
 from typing import Iterable, Iterator
 from urllib.parse import quote
@@ -16,32 +17,27 @@ try:
 except ImportError as exc:  # pragma: no cover - script dependency check
     raise SystemExit("boto3 is required: pip install boto3") from exc
 
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2)
 
-DEFAULT_LIMIT = 1000
-
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional speedup
+    HTTP2_AVAILABLE = False
 
-class IteratorReader:
-    """Wrap an iterator of bytes to provide a file-like read() API."""
 
-    def __init__(self, iterator: Iterator[bytes]) -> None:
-        self._iterator = iterator
-        self._buffer = b""
+DEFAULT_LIMIT = 1000
+# Multipart part size; S3 requires every part but the last to be at least 5 MiB.
+PART_SIZE = 8 * 1024 * 1024
 
-    def read(self, size: int | None = -1) -> bytes:
-        if size is None or size < 0:
-            chunks = [self._buffer]
-            self._buffer = b""
-            chunks.extend(self._iterator)
-            return b"".join(chunks)
 
-        while len(self._buffer) < size:
-            try:
-                self._buffer += next(self._iterator)
-            except StopIteration:
-                break
-        data = self._buffer[:size]
-        self._buffer = self._buffer[size:]
-        return data
+def read_part(chunks: Iterator[bytes], size: int) -> bytes:
+    """Collect at least ``size`` bytes from ``chunks`` (less only at end of stream)."""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= size:
+            break
+    return bytes(buffer)
 
 
 def env_or_default(value: str | None, fallback: str | None) -> str | None:
@@ -84,7 +80,33 @@ def parse_args() -> argparse.Namespace:
         default=os.getenv("S3_FORCE_PATH_STYLE", "true").lower() in {"1", "true", "yes"},
     )
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Objects copied in parallel (default: 16).",
+    )
+    parser.add_argument(
+        "--list-workers",
+        type=int,
+        default=4,
+        help="Supabase folders listed in parallel (default: 4).",
+    )
     parser.add_argument("--skip-existing", action="store_true")
+    parser.add_argument(
+        "--prefetch-existing",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="With --skip-existing, list destination keys once up front instead of a HEAD per key "
+        "(disable for destinations too large to list).",
+    )
+    parser.add_argument(
+        "--skip-existing-conditional",
+        action="store_true",
+        help="Skip existing keys via conditional PUT (If-None-Match: *) instead of HEAD/listing. "
+        "Saves a request per key, but the source is still downloaded; the destination must "
+        "support conditional writes.",
+    )
     parser.add_argument(
         "--no-create-bucket",
         action="store_true",
@@ -118,18 +140,37 @@ def is_folder(item: dict) -> bool:
 
 
 def walk_objects(
-    client: httpx.Client, supabase_url: str, bucket: str, prefix: str
+    client: httpx.Client,
+    supabase_url: str,
+    bucket: str,
+    prefix: str,
+    list_workers: int = 1,
 ) -> Iterable[tuple[str, dict]]:
-    for item in list_objects(client, supabase_url, bucket, prefix):
-        name = item.get("name")
-        if not name:
-            continue
-        if is_folder(item):
-            next_prefix = f"{prefix}{name}/" if prefix else f"{name}/"
-            yield from walk_objects(client, supabase_url, bucket, next_prefix)
-            continue
-        key = f"{prefix}{name}" if prefix else name
-        yield key, item
+    """Yield ``(key, item)`` for every object under ``prefix``.
+
+    Supabase lists one folder at a time (offset-paginated), so folders are the unit of
+    parallelism: up to ``list_workers`` folder listings run at once and each finished
+    folder's subfolders are queued as new listings. No recursion, so deep trees are fine.
+    """
+
+    def list_folder(current: str) -> list[dict]:
+        return list(list_objects(client, supabase_url, bucket, current))
+
+    with ThreadPoolExecutor(max_workers=max(1, list_workers)) as pool:
+        pending: dict[Future, str] = {pool.submit(list_folder, prefix): prefix}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                current = pending.pop(future)
+                for item in future.result():
+                    name = item.get("name")
+                    if not name:
+                        continue
+                    if is_folder(item):
+                        next_prefix = f"{current}{name}/"
+                        pending[pool.submit(list_folder, next_prefix)] = next_prefix
+                        continue
+                    yield f"{current}{name}", item
 
 
 def object_exists(s3, bucket: str, key: str) -> bool:
@@ -143,6 +184,21 @@ def object_exists(s3, bucket: str, key: str) -> bool:
         raise
 
 
+def list_existing(s3, bucket: str, prefix: str) -> dict[str, int]:
+    """Map every destination key under ``prefix`` to its size."""
+    existing: dict[str, int] = {}
+    for page in s3.get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            existing[obj["Key"]] = obj["Size"]
+    return existing
+
+
+def is_precondition_failed(exc: ClientError) -> bool:
+    status = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    code = (exc.response.get("Error") or {}).get("Code")
+    return status == 412 or code == "PreconditionFailed"
+
+
 def ensure_bucket(s3, bucket: str, region: str) -> None:
     try:
         s3.head_bucket(Bucket=bucket)
@@ -175,13 +231,54 @@ def download_and_upload(
     s3_bucket: str,
     key: str,
     content_type: str | None,
-) -> None:
+    if_none_match: bool = False,
+) -> bool:
+    """Copy one object; returns False if a conditional write found the key already there."""
     url = f"{supabase_url}/storage/v1/object/{supabase_bucket}/{quote(key, safe='/')}"
+    extra_args = {"ContentType": content_type} if content_type else {}
+    # S3 checks If-None-Match on PutObject / CompleteMultipartUpload, not on create.
+    condition = {"IfNoneMatch": "*"} if if_none_match else {}
+    # Upload part by part as bytes arrive so memory stays at one part per object.
     with client.stream("GET", url, timeout=None) as resp:
         resp.raise_for_status()
-        reader = IteratorReader(resp.iter_bytes())
-        extra_args = {"ContentType": content_type} if content_type else None
-        s3.upload_fileobj(reader, s3_bucket, key, ExtraArgs=extra_args)
+        chunks = resp.iter_bytes(chunk_size=1024 * 1024)
+        part = read_part(chunks, PART_SIZE)
+        if len(part) < PART_SIZE:
+            try:
+                s3.put_object(Bucket=s3_bucket, Key=key, Body=part, **extra_args, **condition)
+            except ClientError as exc:
+                if if_none_match and is_precondition_failed(exc):
+                    return False
+                raise
+            return True
+
+        upload_id = s3.create_multipart_upload(Bucket=s3_bucket, Key=key, **extra_args)["UploadId"]
+        parts: list[dict[str, object]] = []
+        try:
+            while part:
+                part_number = len(parts) + 1
+                result = s3.upload_part(
+                    Bucket=s3_bucket,
+                    Key=key,
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    Body=part,
+                )
+                parts.append({"ETag": result["ETag"], "PartNumber": part_number})
+                part = read_part(chunks, PART_SIZE)
+            s3.complete_multipart_upload(
+                Bucket=s3_bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+                **condition,
+            )
+        except BaseException as exc:
+            s3.abort_multipart_upload(Bucket=s3_bucket, Key=key, UploadId=upload_id)
+            if if_none_match and isinstance(exc, ClientError) and is_precondition_failed(exc):
+                return False
+            raise
+    return True
 
 
 def main() -> int:
@@ -208,7 +305,16 @@ def main() -> int:
         "Authorization": f"Bearer {args.supabase_key}",
     }
     addressing_style = "path" if args.force_path_style else "virtual"
-    config = BotoConfig(s3={"addressing_style": addressing_style})
+    workers = max(1, args.workers)
+    list_workers = max(1, args.list_workers)
+    # boto3 clients are thread-safe; size the connection pool so workers don't queue on it.
+    # Adaptive retries back off together when the destination throttles parallel writes.
+    config = BotoConfig(
+        s3={"addressing_style": addressing_style},
+        max_pool_connections=workers,
+        retries={"mode": "adaptive", "max_attempts": 10},
+        tcp_keepalive=True,
+    )
     s3 = boto3.client(
         "s3",
         endpoint_url=args.s3_endpoint_url,
@@ -224,30 +330,79 @@ def main() -> int:
     if prefix and not prefix.endswith("/"):
         prefix += "/"
 
+    existing: dict[str, int] | None = None
+    check_existing = args.skip_existing and not args.skip_existing_conditional
+    if check_existing and args.prefetch_existing:
+        existing = list_existing(s3, args.s3_bucket, prefix)
+        print(f"found {len(existing)} existing objects under {prefix or '/'}")
+
+    def already_copied(key: str, metadata: dict) -> bool:
+        if existing is None:
+            return object_exists(s3, args.s3_bucket, key)
+        size = existing.get(key)
+        if size is None:
+            return False
+        # A size mismatch means an earlier copy was cut short; copy it again.
+        source_size = metadata.get("size")
+        return source_size is None or source_size == size
+
+    def copy_one(key: str, item: dict) -> tuple[str, str]:
+        metadata = item.get("metadata") or {}
+        content_type = metadata.get("mimetype")
+        if check_existing and already_copied(key, metadata):
+            return "skip", key
+        if args.dry_run:
+            return "dry", key
+        written = download_and_upload(
+            client,
+            s3,
+            supabase_url,
+            args.supabase_bucket,
+            args.s3_bucket,
+            key,
+            content_type,
+            if_none_match=args.skip_existing_conditional,
+        )
+        return ("copy" if written else "skip"), key
+
     copied = 0
     skipped = 0
-    with httpx.Client(headers=headers) as client:
-        for key, item in walk_objects(client, supabase_url, args.supabase_bucket, prefix):
-            content_type = (item.get("metadata") or {}).get("mimetype")
-            if args.skip_existing and object_exists(s3, args.s3_bucket, key):
-                skipped += 1
-                print(f"skip  {key}")
-                continue
-            if args.dry_run:
+
+    def record(done: Iterable[Future]) -> None:
+        # Only the main thread prints; one write per finished batch instead of per key.
+        nonlocal copied, skipped
+        lines = []
+        for future in done:
+            status, key = future.result()
+            if status == "copy":
+                copied += 1
+            else:
                 skipped += 1
-                print(f"dry   {key}")
-                continue
-            download_and_upload(
-                client,
-                s3,
-                supabase_url,
-                args.supabase_bucket,
-                args.s3_bucket,
-                key,
-                content_type,
-            )
-            copied += 1
-            print(f"copy  {key}")
+            lines.append(f"{status:<5} {key}")
+        if lines:
+            print("\n".join(lines))
+
+    # Keep warm connections for every worker (listing + downloads) and multiplex over
+    # HTTP/2 when available, so parallel GETs don't each pay a TLS handshake.
+    limits = httpx.Limits(
+        max_connections=workers * 2 + list_workers,
+        max_keepalive_connections=workers * 2 + list_workers,
+        keepalive_expiry=60,
+    )
+    timeout = httpx.Timeout(connect=10, read=None, write=60, pool=10)
+    with httpx.Client(
+        headers=headers, http2=HTTP2_AVAILABLE, limits=limits, timeout=timeout
+    ) as client, ThreadPoolExecutor(max_workers=workers) as executor:
+        # Keep at most 2x workers keys in flight so a huge listing isn't queued up front.
+        pending: set[Future] = set()
+        for key, item in walk_objects(
+            client, supabase_url, args.supabase_bucket, prefix, list_workers=list_workers
+        ):
+            pending.add(executor.submit(copy_one, key, item))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                record(done)
+        record(wait(pending).done)
 
     print(f"done  copied={copied} skipped={skipped}")
     return 0
@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import os
 from pathlib import Path
 import random
@@ -13,6 +12,7 @@ from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 
 
 API_BASE = "https://api.pexels.com"
@@ -39,6 +39,8 @@ CATEGORY_QUERIES: Dict[str, List[str]] = {
 PHOTO_SIZES = {"original", "large2x", "large", "medium", "small", "portrait", "landscape", "tiny"}
 ORIENTATIONS = {"landscape", "portrait", "square"}
 VIDEO_QUALITIES = {"sd", "hd", "any"}
+# Cap concurrent Pexels API searches to stay well inside its rate limits.
+FETCH_SEMAPHORE = asyncio.Semaphore(8)
 
 
 def load_env_file(path: Path) -> None:
@@ -152,6 +154,17 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Plan items without downloading files.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="How many files to download at the same time (default: 8).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-download files that already exist in the output directory.",
+    )
     return parser.parse_args()
 
 
@@ -166,9 +179,11 @@ def split_counts(total: int, categories: Sequence[str]) -> Dict[str, int]:
     return counts
 
 
-def pick_query(category: str) -> str:
+def plan_queries(category: str, pages: int, rng: random.Random) -> List[str]:
+    """Pick one query per page, without repeats until every query has been used."""
     queries = CATEGORY_QUERIES.get(category, [category])
-    return random.choice(queries)
+    order = rng.sample(queries, k=len(queries))
+    return [order[index % len(order)] for index in range(max(1, pages))]
 
 
 def build_photo_params(query: str, args: argparse.Namespace, page: int) -> Dict[str, Any]:
@@ -222,20 +237,46 @@ def pick_video_file(video: Dict[str, Any], quality: str) -> Optional[Dict[str, A
 
 
 async def fetch_json(client: httpx.AsyncClient, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    response = await client.get(path, params=params)
+    async with FETCH_SEMAPHORE:
+        response = await client.get(path, params=params)
     response.raise_for_status()
     return response.json()
 
 
+async def fetch_media_page(
+    client: httpx.AsyncClient, kind: str, query: str, args: argparse.Namespace, page: int
+) -> List[Dict[str, Any]]:
+    if kind == "photo":
+        data = await fetch_json(client, "/v1/search", build_photo_params(query, args, page))
+        return data.get("photos", [])
+    data = await fetch_json(client, "/videos/search", build_video_params(query, args, page))
+    return data.get("videos", [])
+
+
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def is_downloaded(dest: Path) -> bool:
+    # download_file only renames complete files into place, so any non-empty file
+    # under the final name is a finished earlier download.
+    try:
+        return dest.stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
+
 async def download_file(client: httpx.AsyncClient, url: str, dest: Path) -> None:
     ensure_dir(dest.parent)
-    response = await client.get(url)
-    response.raise_for_status()
-    dest.write_bytes(response.content)
+    # Stream to a sibling temp file so memory stays at one chunk per download and an
+    # interrupted run never leaves a truncated file under the final name.
+    partial = dest.with_name(dest.name + ".part")
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        with partial.open("wb") as handle:
+            async for chunk in response.aiter_bytes(chunk_size=64 * 1024):
+                handle.write(chunk)
+    partial.replace(dest)
 
 
 def build_attribution(kind: str, creator_name: str, pexels_url: str) -> str:
@@ -248,23 +289,15 @@ async def gather_media_for_category(
     category: str,
     kind: str,
     count: int,
+    queries: Sequence[str],
     args: argparse.Namespace,
 ) -> List[Dict[str, Any]]:
     if count <= 0:
         return []
     results: List[Dict[str, Any]] = []
     seen: set[int] = set()
-    for page in range(1, args.max_pages + 1):
-        query = pick_query(category)
-        if kind == "photo":
-            params = build_photo_params(query, args, page)
-            data = await fetch_json(client, "/v1/search", params)
-            items = data.get("photos", [])
-        else:
-            params = build_video_params(query, args, page)
-            data = await fetch_json(client, "/videos/search", params)
-            items = data.get("videos", [])
 
+    def collect(items: List[Dict[str, Any]], query: str) -> bool:
         for item in items:
             item_id = item.get("id")
             if not isinstance(item_id, int) or item_id in seen:
@@ -275,7 +308,21 @@ async def gather_media_for_category(
             item["_query"] = query
             results.append(item)
             if len(results) >= count:
-                return results
+                return True
+        return False
+
+    query = queries[0]
+    if collect(await fetch_media_page(client, kind, query, args, 1), query):
+        return results
+    # The first page usually covers the count; only when it doesn't are the remaining
+    # pages fetched, all at once (merged in page order to keep selections stable).
+    rest = queries[1 : args.max_pages]
+    pages = await asyncio.gather(
+        *(fetch_media_page(client, kind, query, args, page) for page, query in enumerate(rest, start=2))
+    )
+    for query, items in zip(rest, pages):
+        if collect(items, query):
+            break
     return results
 
 
@@ -299,8 +346,9 @@ async def main() -> None:
     load_env_defaults()
     args = parse_args()
 
-    if args.seed is not None:
-        random.seed(args.seed)
+    # Query plans come from one seeded RNG, drawn in category order, so a given
+    # --seed always produces the same plan.
+    rng = random.Random(args.seed)
 
     if not args.api_key:
         raise SystemExit("Missing API key. Pass --api-key or set PEXELS_API_KEY.")
@@ -313,16 +361,27 @@ async def main() -> None:
     video_counts = split_counts(args.video_total, categories)
 
     manifest: List[Dict[str, Any]] = []
-    attribution_lines: List[str] = []
+    attribution_lines: set[str] = set()
+    downloads: List[Tuple[str, Path]] = []
 
     headers = {"Authorization": args.api_key}
     async with httpx.AsyncClient(base_url=API_BASE, headers=headers, timeout=60.0) as client:
         for category in categories:
             photo_items = await gather_media_for_category(
-                client, category, "photo", photo_counts[category], args
+                client,
+                category,
+                "photo",
+                photo_counts[category],
+                plan_queries(category, args.max_pages, rng),
+                args,
             )
             video_items = await gather_media_for_category(
-                client, category, "video", video_counts[category], args
+                client,
+                category,
+                "video",
+                video_counts[category],
+                plan_queries(category, args.max_pages, rng),
+                args,
             )
 
             for item in photo_items:
@@ -331,10 +390,9 @@ async def main() -> None:
                     continue
                 filename = infer_filename("photo", item, src_url)
                 dest = media_dir(args.out_dir, "photo", category) / filename
-                if not args.dry_run:
-                    await download_file(client, src_url, dest)
+                downloads.append((src_url, dest))
                 attribution = build_attribution("photo", item.get("photographer", "Unknown"), item.get("url", ""))
-                attribution_lines.append(attribution)
+                attribution_lines.add(attribution)
                 manifest.append(
                     {
                         "id": item.get("id"),
@@ -361,11 +419,10 @@ async def main() -> None:
                     continue
                 filename = infer_filename("video", item, src_url)
                 dest = media_dir(args.out_dir, "video", category) / filename
-                if not args.dry_run:
-                    await download_file(client, src_url, dest)
+                downloads.append((src_url, dest))
                 user = item.get("user") or {}
                 attribution = build_attribution("video", user.get("name", "Unknown"), item.get("url", ""))
-                attribution_lines.append(attribution)
+                attribution_lines.add(attribution)
                 manifest.append(
                     {
                         "id": item.get("id"),
@@ -384,16 +441,35 @@ async def main() -> None:
                     }
                 )
 
+        if not args.force:
+            pending = [(url, dest) for url, dest in downloads if not is_downloaded(dest)]
+            skipped = len(downloads) - len(pending)
+            if skipped:
+                print(f"Skipping {skipped} files already present (use --force to re-download)")
+            downloads = pending
+
+        if not args.dry_run:
+            semaphore = asyncio.Semaphore(max(1, args.concurrency))
+
+            async def bounded_download(url: str, dest: Path) -> None:
+                async with semaphore:
+                    await download_file(client, url, dest)
+
+            await asyncio.gather(*(bounded_download(url, dest) for url, dest in downloads))
+
     ensure_dir(args.out_dir)
-    (args.out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    (args.out_dir / "manifest.json").write_bytes(
+        orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
 
-    attribution_lines = sorted(set(attribution_lines))
     attribution_header = [
         "Photos and videos provided by Pexels.",
         "Attribution list:",
         "",
     ]
-    (args.out_dir / "ATTRIBUTION.md").write_text("\n".join(attribution_header + attribution_lines) + "\n")
+    (args.out_dir / "ATTRIBUTION.md").write_text(
+        "\n".join(attribution_header + sorted(attribution_lines)) + "\n"
+    )
 
     print(f"Downloaded {len(manifest)} assets into {args.out_dir}")
 
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
+
+import orjson
 
 
 def parse_args() -> argparse.Namespace:
@@ -49,19 +51,25 @@ def resolve_entry_path(entry_path: str, manifest_path: Path) -> Path:
     # First try relative to current working directory.
     if path.exists():
         return path
-    # Fallback to manifest directory.
-    return (manifest_path.parent / path).resolve()
+    # Fallback to manifest directory. abspath only normalizes the string; symlinks are
+    # resolved once per referenced file in find_orphans.
+    return Path(os.path.abspath(manifest_path.parent / path))
 
 
 def load_manifest(path: Path) -> List[Dict]:
-    data = json.loads(path.read_text())
+    data = orjson.loads(path.read_bytes())
     if not isinstance(data, list):
         raise SystemExit("Manifest JSON is not a list.")
     return data
 
 
 def write_manifest(path: Path, entries: List[Dict]) -> None:
-    path.write_text(json.dumps(entries, indent=2, sort_keys=True) + "\n")
+    path.write_bytes(
+        orjson.dumps(
+            entries,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    )
 
 
 def write_attribution(path: Path, entries: List[Dict]) -> None:
@@ -74,15 +82,35 @@ def write_attribution(path: Path, entries: List[Dict]) -> None:
     path.write_text("\n".join(header + lines) + "\n")
 
 
+def iter_files(root: Path) -> Iterator[Tuple[Path, str]]:
+    """Yield ``(path, real_path)`` for files under ``root``.
+
+    ``os.scandir`` entries carry their file type, and the real path is built from the
+    root's realpath plus the relative name, so only symlinked files need a realpath
+    call. Symlinked directories are not descended into, matching ``rglob``.
+    """
+    stack = [(root, os.path.realpath(root))]
+    while stack:
+        directory, real_directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                path = directory / entry.name
+                real_path = os.path.join(real_directory, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((path, real_path))
+                elif entry.is_file():
+                    yield path, os.path.realpath(real_path) if entry.is_symlink() else real_path
+
+
 def find_orphans(media_dir: Path, referenced: List[Path]) -> List[Path]:
-    referenced_set = {p.resolve() for p in referenced}
+    referenced_set = {os.path.realpath(p) for p in referenced}
     orphans: List[Path] = []
     for base in ("photos", "videos"):
         root = media_dir / base
         if not root.exists():
             continue
-        for path in root.rglob("*"):
-            if path.is_file() and path.resolve() not in referenced_set:
+        for path, real_path in iter_files(root):
+            if real_path not in referenced_set:
                 orphans.append(path)
     return sorted(orphans, key=lambda p: p.as_posix())
 
@@ -5,7 +5,7 @@ Steps performed:
 1. Request a presigned upload URL from the FastAPI service.
 2. Upload the provided asset to the object store using the signed URL.
 3. Call the /upload/ingest endpoint so the Celery worker picks up the item.
-4. Poll Postgres until the item is processed, then report row counts from
+4. Wait on Postgres until the item is processed, then report row counts from
    source_items and processed_content to validate the flow.
 
 Usage example:
@@ -23,7 +23,7 @@ import os
 from pathlib import Path
 import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 from urllib.parse import quote
 
 import asyncpg
@@ -32,6 +32,8 @@ import httpx
 
 DEFAULT_TEST_USER_ID = "00000000-0000-0000-0000-000000000001"
 ITEM_TYPES = ("photo", "video", "audio", "document")
+DONE_CHANNEL = "source_item_done"
+UPLOAD_CHUNK_BYTES = 1024 * 1024
 
 
 def load_env_file(path: Path) -> None:
@@ -126,24 +128,38 @@ async def request_upload_url(
     return resp.json()
 
 
-async def upload_bytes(upload_meta: Dict[str, Any], data: bytes, content_type: str, timeout: float) -> None:
+async def iter_file_chunks(path: Path, chunk_size: int = UPLOAD_CHUNK_BYTES) -> AsyncIterator[bytes]:
+    with path.open("rb") as handle:
+        while chunk := await asyncio.to_thread(handle.read, chunk_size):
+            yield chunk
+
+
+async def upload_bytes(
+    upload_meta: Dict[str, Any],
+    data: AsyncIterator[bytes],
+    size_bytes: int,
+    content_type: str,
+    storage_client: httpx.AsyncClient,
+) -> None:
     url = upload_meta.get("url")
     if not url:
         raise RuntimeError("Upload URL not provided by storage provider; configure Supabase for this script.")
 
     headers = upload_meta.get("headers", {}).copy()
     headers.setdefault("Content-Type", content_type)
+    # Presigned PUTs reject chunked transfer encoding, so the streamed body needs a length.
+    headers["Content-Length"] = str(size_bytes)
 
-    async with httpx.AsyncClient(timeout=timeout) as storage_client:
-        response = await storage_client.put(url, content=data, headers=headers)
-        response.raise_for_status()
+    response = await storage_client.put(url, content=data, headers=headers)
+    response.raise_for_status()
 
 
 async def upload_bytes_supabase(
     key: str,
-    data: bytes,
+    data: AsyncIterator[bytes],
+    size_bytes: int,
     content_type: str,
-    timeout: float,
+    storage_client: httpx.AsyncClient,
 ) -> None:
     supabase_url = os.environ.get("SUPABASE_URL")
     service_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
@@ -157,11 +173,11 @@ async def upload_bytes_supabase(
         "apikey": service_key,
         "Authorization": f"Bearer {service_key}",
         "Content-Type": content_type,
+        "Content-Length": str(size_bytes),
         "x-upsert": "true",
     }
-    async with httpx.AsyncClient(timeout=timeout) as storage_client:
-        response = await storage_client.post(url, content=data, headers=headers)
-        response.raise_for_status()
+    response = await storage_client.post(url, content=data, headers=headers)
+    response.raise_for_status()
 
 
 async def trigger_ingest(
@@ -195,39 +211,71 @@ async def wait_for_completion(pool: asyncpg.pool.Pool, item_id: uuid.UUID, timeo
         FROM source_items
         WHERE id = $1
     """
-
-    while time.time() < deadline:
-        row = await pool.fetchrow(query, item_id)
-        if row and row["processing_status"] in ("completed", "failed"):
-            return dict(row)
-        await asyncio.sleep(2)
+    done = asyncio.Event()
+
+    def on_notify(_conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        if payload == str(item_id):
+            done.set()
+
+    # The source_items_done_notify trigger (migration 018) wakes us as soon as the worker
+    # commits; the 2 s poll remains as a fallback for databases without it. Status reads
+    # reuse the held connection and a statement prepared once for every re-read.
+    async with pool.acquire() as conn:
+        status_stmt = await conn.prepare(query)
+        await conn.add_listener(DONE_CHANNEL, on_notify)
+        try:
+            while True:
+                # Clear before reading so a notification racing the read is not lost.
+                done.clear()
+                row = await status_stmt.fetchrow(item_id)
+                if row and row["processing_status"] in ("completed", "failed"):
+                    return dict(row)
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(done.wait(), timeout=min(2, remaining))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await conn.remove_listener(DONE_CHANNEL, on_notify)
 
     raise TimeoutError("Timed out waiting for process_item to finish")
 
 
 async def collect_counts(pool: asyncpg.pool.Pool) -> Dict[str, Any]:
-    counts = await pool.fetch("SELECT processing_status, COUNT(*) FROM source_items GROUP BY processing_status")
-    content_counts = await pool.fetch("SELECT content_role, COUNT(*) FROM processed_content GROUP BY content_role")
-    return {
-        "source_items": {row["processing_status"]: row["count"] for row in counts},
-        "processed_content": {row["content_role"]: row["count"] for row in content_counts},
-    }
-
-
-async def main() -> None:
-    load_env_defaults()
-    args = parse_args()
-    if not args.file.exists():
-        raise SystemExit(f"File not found: {args.file}")
-
-    file_bytes = args.file.read_bytes()
-    content_type = mimetypes.guess_type(args.file.name)[0] or "application/octet-stream"
-
-    async with httpx.AsyncClient(base_url=args.api_url.rstrip("/"), timeout=args.http_timeout) as api_client:
+    rows = await pool.fetch(
+        """
+        SELECT 'source_items' AS tbl, processing_status AS key, COUNT(*) AS count
+        FROM source_items GROUP BY processing_status
+        UNION ALL
+        SELECT 'processed_content', content_role, COUNT(*)
+        FROM processed_content GROUP BY content_role
+        """
+    )
+    counts: Dict[str, Dict[Any, int]] = {"source_items": {}, "processed_content": {}}
+    for row in rows:
+        counts[row["tbl"]][row["key"]] = row["count"]
+    return counts
+
+
+async def upload_and_ingest(args: argparse.Namespace, content_type: str) -> Dict[str, Any]:
+    # The file is streamed from disk in chunks, so large videos never sit in memory.
+    size_bytes = args.file.stat().st_size
+    # Storage uploads go to a different host than the API, so they get their own pooled
+    # client instead of a fresh connection per request.
+    async with httpx.AsyncClient(
+        base_url=args.api_url.rstrip("/"), timeout=args.http_timeout
+    ) as api_client, httpx.AsyncClient(
+        timeout=args.http_timeout,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    ) as storage_client:
         if args.direct_upload:
             storage_key = f"{args.prefix}/{uuid.uuid4()}-{args.file.name}"
-            print(f"Uploading {args.file.stat().st_size} bytes to Supabase as {storage_key} …")
-            await upload_bytes_supabase(storage_key, file_bytes, content_type, args.http_timeout)
+            print(f"Uploading {size_bytes} bytes to Supabase as {storage_key} …")
+            await upload_bytes_supabase(
+                storage_key, iter_file_chunks(args.file), size_bytes, content_type, storage_client
+            )
         else:
             print(f"Requesting upload URL for {args.file} …")
             try:
@@ -239,12 +287,12 @@ async def main() -> None:
                     ) from exc
                 raise
 
-            print(f"Uploading {args.file.stat().st_size} bytes to storage …")
-            await upload_bytes(upload_meta, file_bytes, content_type, args.http_timeout)
+            print(f"Uploading {size_bytes} bytes to storage …")
+            await upload_bytes(upload_meta, iter_file_chunks(args.file), size_bytes, content_type, storage_client)
             storage_key = upload_meta["key"]
 
         print("Enqueuing ingest task …")
-        ingest_resp = await trigger_ingest(
+        return await trigger_ingest(
             api_client,
             storage_key=storage_key,
             item_type=args.item_type,
@@ -254,10 +302,38 @@ async def main() -> None:
             captured_at=args.captured_at,
         )
 
-    item_id = uuid.UUID(ingest_resp["item_id"])
+
+async def discard_pool(pool_task: asyncio.Task) -> None:
+    # Stop a pending connect, or close the pool if it already finished connecting.
+    pool_task.cancel()
+    try:
+        pool = await pool_task
+    except (asyncio.CancelledError, Exception):
+        return
+    await pool.close()
+
+
+async def main() -> None:
+    load_env_defaults()
+    args = parse_args()
+    if not args.file.exists():
+        raise SystemExit(f"File not found: {args.file}")
+
+    content_type = mimetypes.guess_type(args.file.name)[0] or "application/octet-stream"
+
+    # Connect to Postgres while the upload and ingest requests are in flight; the pool
+    # is only needed once the item has been queued.
+    pool_task = asyncio.create_task(asyncpg.create_pool(dsn=args.postgres_dsn))
+    try:
+        ingest_resp = await upload_and_ingest(args, content_type)
+        item_id = uuid.UUID(ingest_resp["item_id"])
+    except BaseException:
+        await discard_pool(pool_task)
+        raise
+
     print(f"Ingest queued: item_id={ingest_resp['item_id']} task_id={ingest_resp['task_id']}")
 
-    pool = await asyncpg.create_pool(dsn=args.postgres_dsn)
+    pool = await pool_task
     try:
         status_row = await wait_for_completion(pool, item_id, args.timeout)
         print(
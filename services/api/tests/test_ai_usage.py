@@ -0,0 +1,38 @@
+"""Tests for AI usage event routing across loops and threads."""
+
+import asyncio
+
+from app.ai import usage as usage_module
+
+
+def _record_writes(monkeypatch):
+    writes = []
+
+    async def fake_write(event, *, one_off_engine=False):
+        writes.append((asyncio.get_running_loop(), one_off_engine))
+
+    monkeypatch.setattr(usage_module, "_write_usage_event", fake_write)
+    return writes
+
+
+async def test_usage_from_thread_is_written_on_owning_loop(monkeypatch):
+    """Events logged off-loop are handed to the loop that owns the pool."""
+    writes = _record_writes(monkeypatch)
+    owner = asyncio.get_running_loop()
+    monkeypatch.setattr(usage_module, "get_engine_loop", lambda: owner)
+
+    await asyncio.to_thread(usage_module._submit_usage_event, object())
+    await asyncio.sleep(0)
+
+    assert writes == [(owner, False)]
+
+
+def test_usage_without_owner_loop_uses_one_off_engine(monkeypatch):
+    """With no loop owning the pool, the write goes through a one-off engine."""
+    writes = _record_writes(monkeypatch)
+    monkeypatch.setattr(usage_module, "get_engine_loop", lambda: None)
+
+    usage_module._submit_usage_event(object())
+
+    assert len(writes) == 1
+    assert writes[0][1] is True
@@ -1,9 +1,8 @@
 """Tests for the dashboard routes."""
 
 from collections import namedtuple
-from datetime import date, datetime, timezone
+from datetime import date
 from types import SimpleNamespace
-from uuid import uuid4
 
 from fastapi.testclient import TestClient
 
@@ -11,47 +10,48 @@ from app.main import app
 from app.db.session import get_session
 from app.routes import dashboard as dashboard_module
 
-from tests.helpers import FakeResult, FakeSession, FakeStorage, FailingStorage, override_get_session
+from tests.helpers import (
+    FakeResult,
+    FakeSession,
+    FakeStorage,
+    FailingStorage,
+    make_sample_item,
+    override_get_session,
+)
+
+
+ActivityRow = namedtuple("ActivityRow", ["day", "count"])
+
+
+def _dashboard_results(
+    counts: tuple[int, int, int, int, int, int],
+    item: SimpleNamespace,
+    caption_rows: list[SimpleNamespace],
+    usage_row: SimpleNamespace,
+    activity_count: int,
+) -> list[FakeResult]:
+    """Queue the results /dashboard/stats reads, in query order, for a single recent item."""
+    return [
+        FakeResult(scalar=None),  # fetch_user_settings for offset_now
+        FakeResult(scalar=None),  # fetch_user_settings for offset_minutes
+        *(FakeResult(scalar=count) for count in counts),
+        FakeResult(rows=[usage_row]),
+        FakeResult(rows=[usage_row]),
+        FakeResult(scalars=[item]),
+        FakeResult(rows=caption_rows),
+        FakeResult(scalars=[]),
+        FakeResult(rows=[]),
+        FakeResult(rows=[ActivityRow(day=date.today(), count=activity_count)]),
+        FakeResult(rows=[]),
+    ]
 
 
 def test_dashboard_stats_returns_activity_and_recent_items(monkeypatch):
-    item_id = uuid4()
-    created_at = datetime(2025, 12, 24, 6, 28, 51, tzinfo=timezone.utc)
-    item = SimpleNamespace(
-        id=item_id,
-        item_type="photo",
-        captured_at=created_at,
-        event_time_utc=created_at,
-        created_at=created_at,
-        processing_status="completed",
-        storage_key="uploads/ui/example.png",
-        content_type="image/png",
-        original_filename="example.png",
-    )
-    caption_row = SimpleNamespace(item_id=item_id, data={"text": "Example caption"})
-    ActivityRow = namedtuple("ActivityRow", ["day", "count"])
+    item = make_sample_item()
+    caption_row = SimpleNamespace(item_id=item.id, data={"text": "Example caption"})
     UsageRow = SimpleNamespace(prompt_tokens=10, output_tokens=5, total_tokens=15, cost_usd=0.0012)
 
-    fake_session = FakeSession(
-        [
-            FakeResult(scalar=None),  # fetch_user_settings for offset_now
-            FakeResult(scalar=None),  # fetch_user_settings for offset_minutes
-            FakeResult(scalar=4),
-            FakeResult(scalar=2),
-            FakeResult(scalar=1),
-            FakeResult(scalar=0),
-            FakeResult(scalar=3),
-            FakeResult(scalar=4285357),
-            FakeResult(rows=[UsageRow]),
-            FakeResult(rows=[UsageRow]),
-            FakeResult(scalars=[item]),
-            FakeResult(rows=[caption_row]),
-            FakeResult(scalars=[]),
-            FakeResult(rows=[]),
-            FakeResult(rows=[ActivityRow(day=date.today(), count=4)]),
-            FakeResult(rows=[]),
-        ]
-    )
+    fake_session = FakeSession(_dashboard_results((4, 2, 1, 0, 3, 4285357), item, [caption_row], UsageRow, 4))
 
     async def fake_cache_get(_key: str):
         return None
@@ -77,42 +77,10 @@ def test_dashboard_stats_returns_activity_and_recent_items(monkeypatch):
 
 
 def test_dashboard_handles_signing_failures(monkeypatch):
-    item_id = uuid4()
-    created_at = datetime(2025, 12, 24, 6, 28, 51, tzinfo=timezone.utc)
-    item = SimpleNamespace(
-        id=item_id,
-        item_type="photo",
-        captured_at=created_at,
-        event_time_utc=created_at,
-        created_at=created_at,
-        processing_status="completed",
-        storage_key="uploads/ui/example.png",
-        content_type="image/png",
-        original_filename="example.png",
-    )
-    ActivityRow = namedtuple("ActivityRow", ["day", "count"])
+    item = make_sample_item()
     UsageRow = SimpleNamespace(prompt_tokens=0, output_tokens=0, total_tokens=0, cost_usd=0.0)
 
-    fake_session = FakeSession(
-        [
-            FakeResult(scalar=None),  # fetch_user_settings for offset_now
-            FakeResult(scalar=None),  # fetch_user_settings for offset_minutes
-            FakeResult(scalar=1),
-            FakeResult(scalar=1),
-            FakeResult(scalar=0),
-            FakeResult(scalar=0),
-            FakeResult(scalar=1),
-            FakeResult(scalar=0),
-            FakeResult(rows=[UsageRow]),
-            FakeResult(rows=[UsageRow]),
-            FakeResult(scalars=[item]),
-            FakeResult(rows=[]),
-            FakeResult(scalars=[]),
-            FakeResult(rows=[]),
-            FakeResult(rows=[ActivityRow(day=date.today(), count=1)]),
-            FakeResult(rows=[]),
-        ]
-    )
+    fake_session = FakeSession(_dashboard_results((1, 1, 0, 0, 1, 0), item, [], UsageRow, 1))
 
     async def fake_cache_get(_key: str):
         return None
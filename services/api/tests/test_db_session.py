@@ -0,0 +1,25 @@
+"""Tests for worker engine sharing in app.db.session."""
+
+import asyncio
+
+from app.db import session as session_module
+
+
+def test_shared_engine_only_used_on_owning_loop(monkeypatch):
+    """Sessions on any loop but the worker's own fall back to a one-off engine."""
+    worker_loop = asyncio.new_event_loop()
+    monkeypatch.setattr(session_module, "_engine_loop", None)
+    monkeypatch.setattr(session_module, "_share_worker_engine", False)
+    try:
+        session_module.share_engine_for_isolated_sessions(worker_loop)
+
+        async def check() -> bool:
+            return session_module.uses_shared_engine()
+
+        assert worker_loop.run_until_complete(check()) is True
+        assert asyncio.run(check()) is False
+        assert session_module.uses_shared_engine() is False
+    finally:
+        worker_loop.close()
+        session_module.get_sessionmaker.cache_clear()
+        session_module.get_engine.cache_clear()
@@ -0,0 +1,77 @@
+"""Tests for maintenance tasks."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.tasks import maintenance as maintenance_module
+from tests.helpers import FakeResult
+
+
+class _ReembedSession:
+    def __init__(self, contexts):
+        self._results = [FakeResult(scalars=contexts)]
+        self.updates = []
+        self.commits = 0
+
+    async def execute(self, _stmt, params=None):
+        if params is not None:
+            self.updates.append(params)
+            return FakeResult()
+        return self._results.pop(0) if self._results else FakeResult()
+
+    def expunge_all(self):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _patch_sessions(monkeypatch, session):
+    @asynccontextmanager
+    async def fake_isolated_session():
+        yield session
+
+    monkeypatch.setattr(maintenance_module, "isolated_session", fake_isolated_session)
+
+
+def _stale_context():
+    return SimpleNamespace(
+        id=uuid4(),
+        title="Title",
+        summary="Summary",
+        keywords=[],
+        context_type="activity",
+        vector_text="stale",
+    )
+
+
+async def test_reembed_writes_vector_text_after_upsert(monkeypatch):
+    """New vector_text is committed once its embeddings are upserted."""
+    context = _stale_context()
+    session = _ReembedSession([context])
+    _patch_sessions(monkeypatch, session)
+    monkeypatch.setattr(maintenance_module, "upsert_context_embeddings", lambda batch: None)
+
+    result = await maintenance_module._reembed_contexts()
+
+    assert result["updated"] == 1
+    assert session.updates == [[{"id": context.id, "vector_text": context.vector_text}]]
+    assert session.commits == 1
+
+
+async def test_reembed_leaves_vector_text_when_upsert_fails(monkeypatch):
+    """A failed upsert writes nothing, so the next run retries the rows."""
+    session = _ReembedSession([_stale_context()])
+    _patch_sessions(monkeypatch, session)
+
+    def failing_upsert(batch):
+        raise RuntimeError("qdrant unavailable")
+
+    monkeypatch.setattr(maintenance_module, "upsert_context_embeddings", failing_upsert)
+
+    result = await maintenance_module._reembed_contexts()
+
+    assert result["updated"] == 0
+    assert session.updates == []
+    assert session.commits == 0
@@ -0,0 +1,136 @@
+"""Tests for memory graph entity collection and edge layout helpers."""
+
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+from app.tasks import memory_graph
+from app.tasks.memory_graph import _collect_entity_payloads, _edge_pairs
+
+
+def _context(entities=None, location=None) -> SimpleNamespace:
+    return SimpleNamespace(entities=entities, location=location)
+
+
+# ---------------------------------------------------------------------------
+# _collect_entity_payloads tests
+# ---------------------------------------------------------------------------
+
+
+def test_collect_entity_payloads_normalizes_and_dedupes():
+    """Types map through NODE_TYPE_MAP and names dedupe case-insensitively."""
+    context = _context(
+        entities=[
+            {"type": "People", "name": "  Alice   Smith "},
+            {"type": "person", "name": "alice smith"},
+            {"type": "Vehicle", "name": "Bike"},
+            {"type": None, "name": "Thing"},
+            {"type": "person", "name": ""},
+            "not-a-dict",
+        ]
+    )
+    payloads = _collect_entity_payloads(context)
+    assert [(p["node_type"], p["name"]) for p in payloads] == [
+        ("person", "Alice Smith"),
+        ("vehicle", "Bike"),
+        ("other", "Thing"),
+    ]
+
+
+def test_collect_entity_payloads_adds_location_place():
+    """Location name becomes a place node unless already present."""
+    context = _context(
+        entities=[{"type": "location", "name": "Central Park"}],
+        location={"name": "central park", "formatted_address": "NYC"},
+    )
+    assert len(_collect_entity_payloads(context)) == 1
+
+    context = _context(entities=None, location={"place_name": "Cafe"})
+    payloads = _collect_entity_payloads(context)
+    assert payloads[0]["node_type"] == "place"
+    assert payloads[0]["attributes"]["source"] == "location"
+
+
+# ---------------------------------------------------------------------------
+# _edge_pairs tests
+# ---------------------------------------------------------------------------
+
+
+def test_edge_pairs_star_uses_highest_priority_anchor():
+    """Star mode links every node to the person node."""
+    a, b, c = UUID(int=3), UUID(int=1), UUID(int=2)
+    types = {a: "object", b: "topic", c: "person"}
+    pairs = _edge_pairs([a, b, c], types, full_clique=False)
+    assert sorted(pairs) == [(b, c), (c, a)]
+    assert all(left < right for left, right in pairs)
+
+
+def test_edge_pairs_full_clique():
+    """Full-clique mode links every pair once."""
+    nodes = [UUID(int=i) for i in range(1, 5)]
+    pairs = _edge_pairs(nodes, {}, full_clique=True)
+    assert len(pairs) == 6
+    assert _edge_pairs(nodes[:1], {}, full_clique=False) == []
+
+
+# ---------------------------------------------------------------------------
+# _write_context_batch tests
+# ---------------------------------------------------------------------------
+
+
+async def test_write_context_batch_sums_overlapping_edges_across_batches(monkeypatch):
+    """Edges shared by contexts in different batches collapse into one pending row."""
+    resolve_calls = []
+
+    async def fake_resolve_nodes(session, *, user_id, payloads):
+        resolve_calls.append([payload["name_lower"] for payload in payloads])
+        return {(p["node_type"], p["name_lower"]): UUID(int=len(p["name"])) for p in payloads}
+
+    monkeypatch.setattr(memory_graph, "_resolve_nodes", fake_resolve_nodes)
+    item = SimpleNamespace(id=uuid4(), user_id=uuid4())
+    entities = [{"type": "person", "name": "Al"}, {"type": "topic", "name": "Chess"}]
+    node_cache, pending_edges = {}, {}
+
+    for _ in range(2):
+        context = SimpleNamespace(id=uuid4(), entities=entities, location=None)
+        await memory_graph._write_context_batch(
+            None, item, [context], node_cache, pending_edges, full_clique=False
+        )
+
+    assert resolve_calls == [["al", "chess"]]
+    assert len(pending_edges) == 1
+    (row,) = pending_edges.values()
+    assert row["mention_count"] == 2
+    assert row["strength"] == 2.0
+
+
+async def test_resolve_nodes_keys_on_postgres_lowercase(monkeypatch):
+    """Nodes whose Postgres lower() differs from str.lower() still resolve to an id."""
+    existing_id, new_id = uuid4(), uuid4()
+    payloads = [
+        {"node_type": "person", "name": "Al", "name_lower": "al"},
+        {"node_type": "place", "name": "İzmir", "name_lower": "İzmir".lower()},
+        {"node_type": "place", "name": "izmir", "name_lower": "izmir"},
+    ]
+    upserted = []
+
+    class FakeRows:
+        def all(self):
+            return [(1, "al", existing_id), (2, "izmir", None), (3, "izmir", None)]
+
+    class FakeSession:
+        async def execute(self, _stmt, _params=None):
+            return FakeRows()
+
+    async def fake_upsert_nodes(session, *, user_id, payloads):
+        upserted.append([payload["name"] for payload in payloads])
+        return {("place", "izmir"): new_id}
+
+    monkeypatch.setattr(memory_graph, "_upsert_nodes", fake_upsert_nodes)
+    resolved = await memory_graph._resolve_nodes(FakeSession(), user_id=uuid4(), payloads=payloads)
+
+    assert upserted == [["İzmir"]]
+    assert resolved == {
+        ("person", "al"): existing_id,
+        ("place", "İzmir".lower()): new_id,
+        ("place", "izmir"): new_id,
+    }
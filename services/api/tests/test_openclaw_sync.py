@@ -0,0 +1,30 @@
+"""Tests for OpenClaw memory file sync."""
+
+from datetime import date
+
+from app.integrations.openclaw_sync import OpenClawMemorySync
+
+
+def test_sync_memory_entries_skips_only_the_failing_entry(tmp_path, monkeypatch):
+    """One entry that fails to merge does not drop the rest of the day."""
+    sync = OpenClawMemorySync(openclaw_workspace=str(tmp_path), enabled=True)
+    original_merge = sync._merge_memory_entry
+
+    def merge(existing, context, memory_path):
+        if context["id"] == "bad":
+            raise ValueError("malformed context")
+        return original_merge(existing, context, memory_path)
+
+    monkeypatch.setattr(sync, "_merge_memory_entry", merge)
+    contexts = [
+        {"id": "good-1", "title": "First"},
+        {"id": "bad", "title": "Broken"},
+        {"id": "good-2", "title": "Second"},
+    ]
+
+    synced = sync.sync_memory_entries("user", contexts, entry_date=date(2024, 5, 1))
+
+    content = (sync.memory_dir / "2024-05-01.md").read_text(encoding="utf-8")
+    assert synced == 2
+    assert "good-1" in content and "good-2" in content
+    assert "Broken" not in content
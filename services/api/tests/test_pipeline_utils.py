@@ -370,3 +370,11 @@ def test_build_vector_text_whitespace():
     )
     assert "My Title" in result
     assert "My Summary" in result
+
+
+def test_build_vector_text_cached_for_repeat_inputs():
+    """Identical inputs reuse the cached result."""
+    first = build_vector_text("Title", "Summary", ["alpha", "beta"], context_type="activity_context")
+    second = build_vector_text("Title", "Summary", ["alpha", "beta"], context_type="activity_context")
+    assert first is second
+    assert "Keywords: alpha, beta" in first
@@ -1,11 +1,14 @@
 """Tests for recaps helper functions."""
 
 from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import UUID
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from app.recaps import resolve_week_window, WeekWindow
+from app.tasks.recaps import _build_weekly_summary, _collect_source_items
 
 
 # ---------------------------------------------------------------------------
@@ -125,3 +128,30 @@ def test_resolve_week_window_frozen_dataclass():
 
     with pytest.raises(AttributeError):
         result.start_date = date(2020, 1, 1)
+
+
+# ---------------------------------------------------------------------------
+# weekly recap task helper tests
+# ---------------------------------------------------------------------------
+
+
+def _episode_row(title, source_ids, context_type="activity_context"):
+    return SimpleNamespace(title=title, context_type=context_type, source_item_ids=source_ids)
+
+
+def test_collect_source_items_dedupes_and_stops_at_limit():
+    """Source ids keep first-seen order and stop at the limit."""
+    a, b, c = UUID(int=1), UUID(int=2), UUID(int=3)
+    rows = [_episode_row("x", [a, b]), _episode_row("y", None), _episode_row("z", [b, c, a])]
+
+    assert _collect_source_items(rows, 10) == [a, b, c]
+    assert _collect_source_items(rows, 2) == [a, b]
+
+
+def test_build_weekly_summary_from_projected_rows():
+    """Summary is built from plain title/context_type rows."""
+    rows = [_episode_row("Morning run", []), _episode_row(None, []), _episode_row("Recap", [], "weekly_summary")]
+    title, summary, _ = _build_weekly_summary(rows, date(2025, 6, 1), date(2025, 6, 7))
+
+    assert title == "Weekly recap - 2025-06-01 to 2025-06-07"
+    assert summary == "Highlights: Morning run."
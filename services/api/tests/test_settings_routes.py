@@ -11,6 +11,7 @@ from app.auth import get_current_user_id
 from app.db.session import get_session
 from app.config import get_settings
 from app.routes import settings as settings_module
+from app import user_settings as user_settings_module
 
 from tests.helpers import FakeResult, FakeSession, override_get_session, override_current_user_id
 
@@ -89,6 +90,58 @@ def test_update_settings_create_new(monkeypatch):
     assert fake_session.committed
 
 
+def test_update_settings_invalidates_cached_settings(monkeypatch):
+    """Update settings drops the local cached copy and bumps the shared version."""
+    bumped = []
+
+    async def fake_incr(key, _ttl):
+        bumped.append(key)
+
+    monkeypatch.setattr(user_settings_module, "incr_cache_value", fake_incr)
+    user_settings_module._user_settings_cache[TEST_USER_ID] = ({"theme": "dark"}, float("inf"), None)
+    fake_session = FakeSession([FakeResult()])
+
+    app.dependency_overrides[get_session] = override_get_session(fake_session)
+    app.dependency_overrides[get_current_user_id] = override_current_user_id(TEST_USER_ID)
+
+    client = TestClient(app)
+    response = client.put("/settings", json={"settings": {"theme": "light"}})
+
+    assert response.status_code == 200
+    assert TEST_USER_ID not in user_settings_module._user_settings_cache
+    assert bumped == [f"user_settings:version:{TEST_USER_ID}"]
+
+
+async def test_cached_settings_follow_shared_version(monkeypatch):
+    """A version bump from another process refetches; callers get private copies."""
+    versions = {"current": "1"}
+    fetches = []
+
+    async def fake_get(_key):
+        return versions["current"]
+
+    async def fake_fetch(_session, user_id):
+        fetches.append(user_id)
+        return {"theme": {"mode": f"v{len(fetches)}"}}
+
+    monkeypatch.setattr(user_settings_module, "get_cache_value", fake_get)
+    monkeypatch.setattr(user_settings_module, "fetch_user_settings", fake_fetch)
+    monkeypatch.setattr(user_settings_module, "_user_settings_cache", {})
+    stale_user = UUID(int=1)
+    user_settings_module._user_settings_cache[stale_user] = ({}, 0.0, None)
+
+    first = await user_settings_module.fetch_user_settings_cached(None, TEST_USER_ID)
+    first["theme"]["mode"] = "mutated"
+    second = await user_settings_module.fetch_user_settings_cached(None, TEST_USER_ID)
+    versions["current"] = "2"
+    third = await user_settings_module.fetch_user_settings_cached(None, TEST_USER_ID)
+
+    assert second == {"theme": {"mode": "v1"}}
+    assert third == {"theme": {"mode": "v2"}}
+    assert len(fetches) == 2
+    assert stale_user not in user_settings_module._user_settings_cache
+
+
 def test_update_settings_replace_existing(monkeypatch):
     """Update settings replaces existing record."""
     fake_session = FakeSession([FakeResult()])
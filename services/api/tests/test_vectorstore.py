@@ -0,0 +1,216 @@
+"""Tests for vectorstore embedding helpers."""
+
+from app.vectorstore import _deterministic_text_vector, _deterministic_text_vectors
+
+
+# ---------------------------------------------------------------------------
+# Deterministic embedding tests
+# ---------------------------------------------------------------------------
+
+
+def test_deterministic_text_vectors_match_single_text_path():
+    """Batch placeholder vectors equal the per-text vectors, duplicates included."""
+    vectors = _deterministic_text_vectors(["alpha", "beta", "alpha"], 8)
+
+    assert vectors[0] == _deterministic_text_vector("alpha", 8)
+    assert vectors[1] == _deterministic_text_vector("beta", 8)
+    assert vectors[2] == vectors[0]
+    assert vectors[2] is not vectors[0]
+    assert len(vectors[1]) == 8
+
+
+# ---------------------------------------------------------------------------
+# Search tests
+# ---------------------------------------------------------------------------
+
+
+def test_search_contexts_batch_issues_one_query_batch(monkeypatch):
+    """Several queries share one Qdrant call and keep their result order."""
+    import app.vectorstore as vectorstore
+
+    class FakePoint:
+        def __init__(self, point_id, score):
+            self.id = point_id
+            self.score = score
+            self.payload = {"context_id": point_id}
+
+    class FakeResponse:
+        def __init__(self, points):
+            self.points = points
+
+    calls = []
+
+    class FakeClient:
+        def query_batch_points(self, collection_name, requests):
+            calls.append(requests)
+            return [FakeResponse([FakePoint(f"ctx-{idx}", 0.5)]) for idx, _ in enumerate(requests)]
+
+    monkeypatch.setattr(vectorstore, "get_qdrant_client", lambda: FakeClient())
+    monkeypatch.setattr(vectorstore, "ensure_collection", lambda size: None)
+    monkeypatch.setattr(
+        vectorstore, "embed_texts", lambda texts, **kwargs: [[0.1, 0.2] for _ in texts]
+    )
+
+    results = vectorstore.search_contexts_batch(["first", "second"], limit=3, user_id="user-1")
+
+    assert len(calls) == 1
+    assert [request.limit for request in calls[0]] == [3, 3]
+    assert [result[0]["context_id"] for result in results] == ["ctx-0", "ctx-1"]
+    assert vectorstore.search_contexts_batch([]) == []
+
+
+# ---------------------------------------------------------------------------
+# Gemini embedding tests
+# ---------------------------------------------------------------------------
+
+
+class _FakeEmbedding:
+    def __init__(self, values):
+        self.values = values
+
+
+class _FakeResponse:
+    def __init__(self, contents):
+        self.embeddings = [_FakeEmbedding([float(len(text)), 0.5]) for text in contents]
+
+
+class _FakeGenaiClient:
+    def __init__(self):
+        self.sent = []
+        self.models = self
+
+    def embed_content(self, model, contents):
+        self.sent.append(list(contents))
+        return _FakeResponse(contents)
+
+
+def test_embed_texts_only_sends_cache_misses(monkeypatch):
+    """Cached texts are served from Redis; misses are embedded once and stored."""
+    import numpy as np
+
+    import app.vectorstore as vectorstore
+    from app.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "embedding_provider", "gemini")
+    monkeypatch.setattr(settings, "embedding_cache_ttl_seconds", 60)
+    cached_key = vectorstore._embedding_cache_key(settings.embedding_model, "cached")
+    store = {cached_key: np.asarray([1.0, 2.0], dtype=np.float32).tobytes()}
+    monkeypatch.setattr(vectorstore, "get_cache_bytes_many", lambda keys: [store.get(key) for key in keys])
+    monkeypatch.setattr(vectorstore, "set_cache_bytes_many", lambda entries, ttl: store.update(entries))
+    monkeypatch.setattr(vectorstore, "log_usage_from_response", lambda *args, **kwargs: None)
+
+    client = _FakeGenaiClient()
+    monkeypatch.setattr(vectorstore, "_get_genai_client", lambda: client)
+
+    vectors = vectorstore.embed_texts(["cached", "new", "new"])
+
+    assert client.sent == [["new"]]
+    assert vectors == [[1.0, 2.0], [3.0, 0.5], [3.0, 0.5]]
+    assert vectorstore._embedding_cache_key(settings.embedding_model, "new") in store
+
+
+def test_embed_texts_keeps_order_across_concurrent_batches(monkeypatch):
+    """Batches dispatched through the executor are reassembled in input order."""
+    import app.vectorstore as vectorstore
+    from app.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "embedding_provider", "gemini")
+    monkeypatch.setattr(settings, "embedding_cache_ttl_seconds", 0)
+    monkeypatch.setattr(settings, "embedding_batch_size", 2)
+    monkeypatch.setattr(vectorstore, "log_usage_from_response", lambda *args, **kwargs: None)
+    client = _FakeGenaiClient()
+    monkeypatch.setattr(vectorstore, "_get_genai_client", lambda: client)
+
+    texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+    vectors = vectorstore.embed_texts(texts)
+
+    assert len(client.sent) == 3
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_concurrent_search_embeddings_share_one_call(monkeypatch):
+    """Searches that arrive while another is embedding are embedded together."""
+    import threading
+
+    import app.vectorstore as vectorstore
+    from app.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "embedding_provider", "gemini")
+    monkeypatch.setattr(settings, "search_embed_coalesce_ms", 2000)
+    monkeypatch.setattr(settings, "embedding_batch_size", 2)
+
+    calls = []
+    first_started = threading.Event()
+    release_first = threading.Event()
+
+    def fake_embed_texts(texts, **kwargs):
+        calls.append(sorted(texts))
+        if texts == ["first"]:
+            first_started.set()
+            release_first.wait(timeout=5)
+        return [[float(len(text))] for text in texts]
+
+    monkeypatch.setattr(vectorstore, "embed_texts", fake_embed_texts)
+    results = {}
+
+    def search(text):
+        results[text] = vectorstore._embed_search_query(text, "user-1")
+
+    first = threading.Thread(target=search, args=("first",))
+    first.start()
+    assert first_started.wait(timeout=5)
+    followers = [threading.Thread(target=search, args=(text,)) for text in ("second", "third!")]
+    for thread in followers:
+        thread.start()
+    for thread in followers:
+        thread.join(timeout=5)
+    release_first.set()
+    first.join(timeout=5)
+
+    assert calls == [["first"], ["second", "third!"]]
+    assert results == {"first": [5.0], "second": [6.0], "third!": [6.0]}
+
+
+def test_search_embeddings_for_other_users_do_not_wait(monkeypatch):
+    """A search is embedded at once while another user's batch is in flight."""
+    import threading
+    import time
+
+    import app.vectorstore as vectorstore
+    from app.config import get_settings
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "embedding_provider", "gemini")
+    monkeypatch.setattr(settings, "search_embed_coalesce_ms", 2000)
+
+    first_started = threading.Event()
+    release_first = threading.Event()
+
+    def fake_embed_texts(texts, **kwargs):
+        if kwargs["user_id"] == "user-1":
+            first_started.set()
+            release_first.wait(timeout=5)
+        return [[float(len(text))] for text in texts]
+
+    monkeypatch.setattr(vectorstore, "embed_texts", fake_embed_texts)
+    first = threading.Thread(target=vectorstore._embed_search_query, args=("first", "user-1"))
+    first.start()
+    assert first_started.wait(timeout=5)
+    try:
+        started = time.monotonic()
+        assert vectorstore._embed_search_query("other", "user-2") == [5.0]
+        assert time.monotonic() - started < 1
+    finally:
+        release_first.set()
+        first.join(timeout=5)
+
+
+def test_deterministic_text_vector_returns_fresh_list():
+    """Mutating one returned vector does not leak into later calls."""
+    first = _deterministic_text_vector("alpha", 8)
+    first[0] = -1.0
+
+    assert _deterministic_text_vector("alpha", 8)[0] != -1.0